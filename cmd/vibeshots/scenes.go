@@ -3,6 +3,7 @@ package main
 import (
 	"fmt"
 	"os"
+	"time"
 
 	"github.com/charmbracelet/lipgloss"
 	"github.com/joshuadavidthomas/vibeusage/internal/display"
@@ -24,13 +25,14 @@ func sceneHero() {
 		mockCopilotSnapshot(),
 	}
 
-	cw := display.GlobalPeriodColWidths(snapshots)
+	now := time.Now()
+	cw := display.GlobalPeriodColWidths(snapshots, now)
 
 	for i, snap := range snapshots {
 		if i > 0 {
 			fmt.Println()
 		}
-		fmt.Println(display.RenderProviderPanel(snap, false, cw))
+		fmt.Println(display.RenderProviderPanel(snap, false, cw, now))
 	}
 }
 
@@ -99,13 +101,14 @@ func sceneDashboard() {
 		mockGeminiSnapshot(),
 	}
 
-	cw := display.GlobalPeriodColWidths(snapshots)
+	now := time.Now()
+	cw := display.GlobalPeriodColWidths(snapshots, now)
 
 	for i, snap := range snapshots {
 		if i > 0 {
 			fmt.Println()
 		}
-		fmt.Println(display.RenderProviderPanel(snap, false, cw))
+		fmt.Println(display.RenderProviderPanel(snap, false, cw, now))
 	}
 }
 
@@ -177,12 +177,26 @@ func loadMultipliers(ctx context.Context) (multiplierCatalog, error) {
 		catalog = make(multiplierCatalog)
 	}
 
+	// The two sources are independent, so fetch them concurrently and apply
+	// the results in a fixed order.
+	type fetchedText struct {
+		raw string
+		err error
+	}
+	goFetched := make(chan fetchedText, 1)
+	go func() {
+		raw, err := fetchGoMultipliersMarkdown(ctx)
+		goFetched <- fetchedText{raw: raw, err: err}
+	}()
+	copilotRaw, copilotErr := fetchMultipliersYAML(ctx)
+	goResult := <-goFetched
+
 	copilotRefreshed := false
-	if raw, err := fetchMultipliersYAML(ctx); err != nil {
+	if copilotErr != nil {
 		if ctx.Err() != nil {
 			return nil, fmt.Errorf("loading model multipliers: %w", ctx.Err())
 		}
-	} else if providerMultipliers := parseMultipliersYAML(raw); providerMultipliers == nil {
+	} else if providerMultipliers := parseMultipliersYAML(copilotRaw); providerMultipliers == nil {
 		delete(catalog, copilotMultiplierProvider)
 	} else {
 		catalog[copilotMultiplierProvider] = providerMultipliers
@@ -190,11 +204,11 @@ func loadMultipliers(ctx context.Context) (multiplierCatalog, error) {
 	}
 
 	goRefreshed := false
-	if raw, err := fetchGoMultipliersMarkdown(ctx); err != nil {
+	if goResult.err != nil {
 		if ctx.Err() != nil {
 			return nil, fmt.Errorf("loading model multipliers: %w", ctx.Err())
 		}
-	} else if providerMultipliers := parseGoMultipliers(raw); providerMultipliers == nil {
+	} else if providerMultipliers := parseGoMultipliers(goResult.raw); providerMultipliers == nil {
 		delete(catalog, opencodeMultiplierProvider)
 	} else {
 		catalog[opencodeMultiplierProvider] = providerMultipliers
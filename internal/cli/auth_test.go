@@ -34,9 +34,7 @@ func TestAuthProvider_PassesCallerContextToCustomFlow(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, tmpDir)
 	config.Override(t, config.DefaultConfig())
 
-	oldQuiet := quiet
-	quiet = true
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &quiet, true)
 
 	marker := &struct{}{}
 	ctx := context.WithValue(context.Background(), authContextKey{}, marker)
@@ -252,17 +250,9 @@ func TestAuthStatusCommand_HasTableBorders(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldNoColor := noColor
-	noColor = false
-	defer func() { noColor = oldNoColor }()
-
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
-
-	oldJSON := jsonOutput
-	jsonOutput = false
-	defer func() { jsonOutput = oldJSON }()
+	setFlagForTest(t, &noColor, false)
+	setFlagForTest(t, &quiet, false)
+	setFlagForTest(t, &jsonOutput, false)
 
 	_ = authStatusCommand()
 
@@ -282,17 +272,9 @@ func TestAuthStatusCommand_ContainsHeaders(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldNoColor := noColor
-	noColor = true
-	defer func() { noColor = oldNoColor }()
-
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
-
-	oldJSON := jsonOutput
-	jsonOutput = false
-	defer func() { jsonOutput = oldJSON }()
+	setFlagForTest(t, &noColor, true)
+	setFlagForTest(t, &quiet, false)
+	setFlagForTest(t, &jsonOutput, false)
 
 	_ = authStatusCommand()
 
@@ -313,13 +295,8 @@ func TestAuthStatusCommand_QuietMode(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldQuiet := quiet
-	quiet = true
-	defer func() { quiet = oldQuiet }()
-
-	oldJSON := jsonOutput
-	jsonOutput = false
-	defer func() { jsonOutput = oldJSON }()
+	setFlagForTest(t, &quiet, true)
+	setFlagForTest(t, &jsonOutput, false)
 
 	_ = authStatusCommand()
 
@@ -835,9 +812,7 @@ func TestAuthStatusJSON_UsesTypedStruct(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldJSON := jsonOutput
-	jsonOutput = true
-	defer func() { jsonOutput = oldJSON }()
+	setFlagForTest(t, &jsonOutput, true)
 
 	_ = authStatusCommand()
 
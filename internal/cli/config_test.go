@@ -99,9 +99,7 @@ func TestConfigResetJSON_UsesTypedStruct(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldJSON := jsonOutput
-	jsonOutput = true
-	defer func() { jsonOutput = oldJSON }()
+	setFlagForTest(t, &jsonOutput, true)
 
 	_ = configResetCmd.Flags().Set("confirm", "true")
 	defer func() { _ = configResetCmd.Flags().Set("confirm", "false") }()
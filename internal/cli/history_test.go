@@ -388,9 +388,7 @@ func TestRunHistoryRecordBypassesFreshCacheAndWritesLiveSample(t *testing.T) {
 			Periods:   []models.UsagePeriod{{Name: "Daily", PeriodType: models.PeriodDaily}},
 		})}},
 	}
-	oldNoCache := noCache
-	noCache = false
-	t.Cleanup(func() { noCache = oldNoCache })
+	setFlagForTest(t, &noCache, false)
 
 	if err := runHistoryRecordWith(historyRecordCmd, config.DefaultConfig(), providerMap); err != nil {
 		t.Fatalf("runHistoryRecordWith() error = %v", err)
@@ -425,9 +423,7 @@ func TestRunHistoryRecordRejectsDisabledAndCachedOnlyRuns(t *testing.T) {
 	}); err != nil {
 		t.Fatalf("saving throttle: %v", err)
 	}
-	oldNoCache := noCache
-	noCache = false
-	t.Cleanup(func() { noCache = oldNoCache })
+	setFlagForTest(t, &noCache, false)
 
 	if err := runHistoryRecordWith(historyRecordCmd, config.DefaultConfig(), providerMap); err == nil || !strings.Contains(err.Error(), "cached data only") {
 		t.Fatalf("cached-only history record error = %v", err)
@@ -7,13 +7,8 @@ import (
 )
 
 func TestNewConfiguredLogger_Verbose(t *testing.T) {
-	oldVerbose := verbose
-	verbose = true
-	defer func() { verbose = oldVerbose }()
-
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &verbose, true)
+	setFlagForTest(t, &quiet, false)
 
 	l := newConfiguredLogger()
 
@@ -23,13 +18,8 @@ func TestNewConfiguredLogger_Verbose(t *testing.T) {
 }
 
 func TestNewConfiguredLogger_Quiet(t *testing.T) {
-	oldQuiet := quiet
-	quiet = true
-	defer func() { quiet = oldQuiet }()
-
-	oldVerbose := verbose
-	verbose = false
-	defer func() { verbose = oldVerbose }()
+	setFlagForTest(t, &quiet, true)
+	setFlagForTest(t, &verbose, false)
 
 	l := newConfiguredLogger()
 
@@ -39,13 +29,8 @@ func TestNewConfiguredLogger_Quiet(t *testing.T) {
 }
 
 func TestNewConfiguredLogger_Default(t *testing.T) {
-	oldVerbose := verbose
-	verbose = false
-	defer func() { verbose = oldVerbose }()
-
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &verbose, false)
+	setFlagForTest(t, &quiet, false)
 
 	l := newConfiguredLogger()
 
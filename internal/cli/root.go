@@ -317,7 +317,8 @@ func displayMultipleSnapshots(ctx context.Context, outcomes map[string]fetch.Fet
 			snapshots = append(snapshots, *o.Snapshot)
 		}
 	}
-	colWidths := display.GlobalPeriodColWidths(snapshots)
+	now := time.Now()
+	colWidths := display.GlobalPeriodColWidths(snapshots, now)
 
 	for _, pid := range ids {
 		outcome := outcomes[pid]
@@ -332,7 +333,7 @@ func displayMultipleSnapshots(ctx context.Context, outcomes map[string]fetch.Fet
 				out("%s %s: %d%%\n", pid, p.Name, p.Utilization)
 			}
 		} else {
-			outln(display.RenderProviderPanel(snap, outcome.Cached, colWidths))
+			outln(display.RenderProviderPanel(snap, outcome.Cached, colWidths, now))
 		}
 	}
 
@@ -30,6 +30,15 @@ func resetPathFlags(t *testing.T) {
 	})
 }
 
+// setFlagForTest sets a package-level flag variable for the duration of the
+// test and registers cleanup to restore its previous value.
+func setFlagForTest[T any](t *testing.T, flag *T, value T) {
+	t.Helper()
+	old := *flag
+	*flag = value
+	t.Cleanup(func() { *flag = old })
+}
+
 func collectCommandPaths(cmd *cobra.Command, prefix []string) [][]string {
 	paths := [][]string{append([]string{}, prefix...)}
 	for _, sub := range cmd.Commands() {
@@ -151,13 +160,8 @@ func TestConfigShow_DefaultOutput(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, tmpDir)
 	config.Override(t, config.DefaultConfig())
 
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
-
-	oldJSON := jsonOutput
-	jsonOutput = false
-	defer func() { jsonOutput = oldJSON }()
+	setFlagForTest(t, &quiet, false)
+	setFlagForTest(t, &jsonOutput, false)
 
 	if err := configShowCmd.RunE(configShowCmd, nil); err != nil {
 		t.Fatalf("config show error: %v", err)
@@ -182,13 +186,8 @@ func TestConfigShow_QuietMode(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, tmpDir)
 	config.Override(t, config.DefaultConfig())
 
-	oldQuiet := quiet
-	quiet = true
-	defer func() { quiet = oldQuiet }()
-
-	oldJSON := jsonOutput
-	jsonOutput = false
-	defer func() { jsonOutput = oldJSON }()
+	setFlagForTest(t, &quiet, true)
+	setFlagForTest(t, &jsonOutput, false)
 
 	if err := configShowCmd.RunE(configShowCmd, nil); err != nil {
 		t.Fatalf("config show error: %v", err)
@@ -210,9 +209,7 @@ func TestConfigShow_JSONOutput(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, tmpDir)
 	config.Override(t, config.DefaultConfig())
 
-	oldJSON := jsonOutput
-	jsonOutput = true
-	defer func() { jsonOutput = oldJSON }()
+	setFlagForTest(t, &jsonOutput, true)
 
 	if err := configShowCmd.RunE(configShowCmd, nil); err != nil {
 		t.Fatalf("config show --json error: %v", err)
@@ -254,13 +251,8 @@ func TestConfigPath_DefaultOutput(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, tmpDir)
 	config.Override(t, config.DefaultConfig())
 
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
-
-	oldJSON := jsonOutput
-	jsonOutput = false
-	defer func() { jsonOutput = oldJSON }()
+	setFlagForTest(t, &quiet, false)
+	setFlagForTest(t, &jsonOutput, false)
 
 	resetPathFlags(t)
 
@@ -285,13 +277,8 @@ func TestConfigPath_QuietMode(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, tmpDir)
 	config.Override(t, config.DefaultConfig())
 
-	oldQuiet := quiet
-	quiet = true
-	defer func() { quiet = oldQuiet }()
-
-	oldJSON := jsonOutput
-	jsonOutput = false
-	defer func() { jsonOutput = oldJSON }()
+	setFlagForTest(t, &quiet, true)
+	setFlagForTest(t, &jsonOutput, false)
 
 	resetPathFlags(t)
 
@@ -314,9 +301,7 @@ func TestConfigPath_JSONOutput(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, tmpDir)
 	config.Override(t, config.DefaultConfig())
 
-	oldJSON := jsonOutput
-	jsonOutput = true
-	defer func() { jsonOutput = oldJSON }()
+	setFlagForTest(t, &jsonOutput, true)
 
 	resetPathFlags(t)
 
@@ -345,13 +330,8 @@ func TestConfigPath_CacheFlag(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, tmpDir)
 	config.Override(t, config.DefaultConfig())
 
-	oldQuiet := quiet
-	quiet = true
-	defer func() { quiet = oldQuiet }()
-
-	oldJSON := jsonOutput
-	jsonOutput = false
-	defer func() { jsonOutput = oldJSON }()
+	setFlagForTest(t, &quiet, true)
+	setFlagForTest(t, &jsonOutput, false)
 
 	resetPathFlags(t)
 	_ = configPathCmd.Flags().Set("cache", "true")
@@ -451,9 +431,7 @@ func TestVerboseOutput_MultipleSnapshots_LogsDuration(t *testing.T) {
 	outWriter = &outBuf
 	defer func() { outWriter = os.Stdout }()
 
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &quiet, false)
 
 	outcomes := map[string]fetch.FetchOutcome{
 		"claude": {
@@ -484,9 +462,7 @@ func TestVerboseOutput_MultipleSnapshots_LogsErrors(t *testing.T) {
 	outWriter = &outBuf
 	defer func() { outWriter = os.Stdout }()
 
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &quiet, false)
 
 	outcomes := map[string]fetch.FetchOutcome{
 		"claude": {
@@ -522,9 +498,7 @@ func TestVerboseOutput_MultipleSnapshots_SuppressedWhenNotVerbose(t *testing.T)
 	outWriter = &outBuf
 	defer func() { outWriter = os.Stdout }()
 
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &quiet, false)
 
 	outcomes := map[string]fetch.FetchOutcome{
 		"claude": {
@@ -552,13 +526,8 @@ func TestVerboseOutput_StatusTable_SuppressedInQuiet(t *testing.T) {
 	outWriter = &outBuf
 	defer func() { outWriter = os.Stdout }()
 
-	oldQuiet := quiet
-	quiet = true
-	defer func() { quiet = oldQuiet }()
-
-	oldNoColor := noColor
-	noColor = true
-	defer func() { noColor = oldNoColor }()
+	setFlagForTest(t, &quiet, true)
+	setFlagForTest(t, &noColor, true)
 
 	statuses := map[string]models.ProviderStatus{
 		"claude": {Level: models.StatusOperational},
@@ -581,9 +550,7 @@ func TestVerboseOutput_NotOnStdout(t *testing.T) {
 	outWriter = &outBuf
 	defer func() { outWriter = os.Stdout }()
 
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &quiet, false)
 
 	outcomes := map[string]fetch.FetchOutcome{
 		"claude": {
@@ -616,9 +583,7 @@ func TestDisplayMultipleSnapshots_NoDataWithErrors_ShowsProviderErrors(t *testin
 	outWriter = &outBuf
 	defer func() { outWriter = os.Stdout }()
 
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &quiet, false)
 
 	outcomes := map[string]fetch.FetchOutcome{
 		"claude": {
@@ -669,9 +634,7 @@ func TestRunStatusline_RejectsDisabledExplicitProvider(t *testing.T) {
 	cfg.Providers["gemini"] = config.ProviderConfig{Enabled: &disabled}
 	config.Override(t, cfg)
 
-	oldProviders := statuslineProviders
-	statuslineProviders = []string{"gemini"}
-	defer func() { statuslineProviders = oldProviders }()
+	setFlagForTest(t, &statuslineProviders, []string{"gemini"})
 
 	cmd := &cobra.Command{}
 	cmd.SetContext(context.Background())
@@ -691,9 +654,7 @@ func TestDisplayMultipleSnapshots_NoDataNoErrors_ShowsConfigureHint(t *testing.T
 	outWriter = &outBuf
 	defer func() { outWriter = os.Stdout }()
 
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &quiet, false)
 
 	outcomes := map[string]fetch.FetchOutcome{}
 	displayMultipleSnapshots(ctx, outcomes, 0)
@@ -22,9 +22,7 @@ func TestPreloadModelDataReturnsCancellationWithoutSpinner(t *testing.T) {
 	t.Cleanup(catalog.ResetForTesting)
 	t.Cleanup(catalog.ResetMultipliersForTesting)
 
-	oldQuiet := quiet
-	quiet = true
-	t.Cleanup(func() { quiet = oldQuiet })
+	setFlagForTest(t, &quiet, true)
 
 	ctx, cancel := context.WithCancel(context.Background())
 	cancel()
@@ -85,9 +83,7 @@ func TestDisplayRecommendation_WithCandidates(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldNoColor := noColor
-	noColor = true
-	defer func() { noColor = oldNoColor }()
+	setFlagForTest(t, &noColor, true)
 
 	if err := displayRecommendation(rec); err != nil {
 		t.Fatalf("unexpected error: %v", err)
@@ -155,9 +151,7 @@ func TestDisplayRoleRecommendation_WithCandidates(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldNoColor := noColor
-	noColor = true
-	defer func() { noColor = oldNoColor }()
+	setFlagForTest(t, &noColor, true)
 
 	if err := displayRoleRecommendation(rec); err != nil {
 		t.Fatalf("unexpected error: %v", err)
@@ -186,9 +180,7 @@ func TestRenderRouteTable_RendersHeaders(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldNoColor := noColor
-	noColor = true
-	defer func() { noColor = oldNoColor }()
+	setFlagForTest(t, &noColor, true)
 
 	renderRouteTable(ft)
 
@@ -35,9 +35,7 @@ func TestDisplayStatusTable_ContainsProviderData(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldNoColor := noColor
-	noColor = true
-	defer func() { noColor = oldNoColor }()
+	setFlagForTest(t, &noColor, true)
 
 	displayStatusTable(context.Background(), statuses, 100)
 
@@ -61,13 +59,8 @@ func TestDisplayStatusTable_HasTableBorders(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldNoColor := noColor
-	noColor = false
-	defer func() { noColor = oldNoColor }()
-
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &noColor, false)
+	setFlagForTest(t, &quiet, false)
 
 	displayStatusTable(context.Background(), statuses, 0)
 
@@ -92,9 +85,7 @@ func TestDisplayStatusTable_QuietMode(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldQuiet := quiet
-	quiet = true
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &quiet, true)
 
 	displayStatusTable(context.Background(), statuses, 0)
 
@@ -121,9 +112,7 @@ func TestDisplayStatusTable_VerboseShowsDuration(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &quiet, false)
 
 	displayStatusTable(ctx, statuses, 250)
 
@@ -142,13 +131,8 @@ func TestDisplayStatusTable_Headers(t *testing.T) {
 	outWriter = &buf
 	defer func() { outWriter = os.Stdout }()
 
-	oldNoColor := noColor
-	noColor = true
-	defer func() { noColor = oldNoColor }()
-
-	oldQuiet := quiet
-	quiet = false
-	defer func() { quiet = oldQuiet }()
+	setFlagForTest(t, &noColor, true)
+	setFlagForTest(t, &quiet, false)
 
 	displayStatusTable(context.Background(), statuses, 0)
 
@@ -53,21 +53,10 @@ func TestRunUpdate_CheckJSON(t *testing.T) {
 	updaterFactory = func() updater.Service { return service }
 	defer func() { updaterFactory = oldFactory }()
 
-	oldJSON := jsonOutput
-	jsonOutput = true
-	defer func() { jsonOutput = oldJSON }()
-
-	oldCheckOnly := updateCheckOnly
-	updateCheckOnly = true
-	defer func() { updateCheckOnly = oldCheckOnly }()
-
-	oldYes := updateYes
-	updateYes = false
-	defer func() { updateYes = oldYes }()
-
-	oldVersionFlag := updateVersion
-	updateVersion = ""
-	defer func() { updateVersion = oldVersionFlag }()
+	setFlagForTest(t, &jsonOutput, true)
+	setFlagForTest(t, &updateCheckOnly, true)
+	setFlagForTest(t, &updateYes, false)
+	setFlagForTest(t, &updateVersion, "")
 
 	var buf bytes.Buffer
 	outWriter = &buf
@@ -107,17 +96,9 @@ func TestRunUpdate_ApplyRequiresYesNonInteractive(t *testing.T) {
 	selfUpdateSupportChecker = func() error { return nil }
 	defer func() { selfUpdateSupportChecker = oldSupportChecker }()
 
-	oldJSON := jsonOutput
-	jsonOutput = false
-	defer func() { jsonOutput = oldJSON }()
-
-	oldCheckOnly := updateCheckOnly
-	updateCheckOnly = false
-	defer func() { updateCheckOnly = oldCheckOnly }()
-
-	oldYes := updateYes
-	updateYes = false
-	defer func() { updateYes = oldYes }()
+	setFlagForTest(t, &jsonOutput, false)
+	setFlagForTest(t, &updateCheckOnly, false)
+	setFlagForTest(t, &updateYes, false)
 
 	err := runUpdate(context.Background())
 	if err == nil {
@@ -150,21 +131,10 @@ func TestRunUpdate_ApplyWithYes(t *testing.T) {
 	selfUpdateSupportChecker = func() error { return nil }
 	defer func() { selfUpdateSupportChecker = oldSupportChecker }()
 
-	oldJSON := jsonOutput
-	jsonOutput = false
-	defer func() { jsonOutput = oldJSON }()
-
-	oldCheckOnly := updateCheckOnly
-	updateCheckOnly = false
-	defer func() { updateCheckOnly = oldCheckOnly }()
-
-	oldYes := updateYes
-	updateYes = true
-	defer func() { updateYes = oldYes }()
-
-	oldVersionFlag := updateVersion
-	updateVersion = ""
-	defer func() { updateVersion = oldVersionFlag }()
+	setFlagForTest(t, &jsonOutput, false)
+	setFlagForTest(t, &updateCheckOnly, false)
+	setFlagForTest(t, &updateYes, true)
+	setFlagForTest(t, &updateVersion, "")
 
 	var buf bytes.Buffer
 	outWriter = &buf
@@ -188,9 +158,7 @@ func TestRunUpdate_CheckError(t *testing.T) {
 	updaterFactory = func() updater.Service { return service }
 	defer func() { updaterFactory = oldFactory }()
 
-	oldCheckOnly := updateCheckOnly
-	updateCheckOnly = true
-	defer func() { updateCheckOnly = oldCheckOnly }()
+	setFlagForTest(t, &updateCheckOnly, true)
 
 	err := runUpdate(context.Background())
 	if err == nil {
@@ -214,9 +182,7 @@ func TestRunUpdate_UnmanagedInstallRejected(t *testing.T) {
 	}
 	defer func() { selfUpdateSupportChecker = oldSupportChecker }()
 
-	oldCheckOnly := updateCheckOnly
-	updateCheckOnly = false
-	defer func() { updateCheckOnly = oldCheckOnly }()
+	setFlagForTest(t, &updateCheckOnly, false)
 
 	err := runUpdate(context.Background())
 	if err == nil {
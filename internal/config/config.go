@@ -7,7 +7,7 @@ import (
 	"os"
 	"path/filepath"
 	"sort"
-	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/BurntSushi/toml"
@@ -49,6 +49,9 @@ type Config struct {
 	Roles       map[string]RoleConfig     `toml:"roles" json:"roles"`
 }
 
+// defaultFetchTimeout is the per-request fetch timeout in seconds.
+const defaultFetchTimeout = 30.0
+
 func DefaultConfig() Config {
 	return Config{
 		Display: DisplayConfig{
@@ -56,7 +59,7 @@ func DefaultConfig() Config {
 			ResetFormat:   "countdown",
 		},
 		Fetch: FetchConfig{
-			Timeout:       30.0,
+			Timeout:       defaultFetchTimeout,
 			MaxConcurrent: 5,
 		},
 		Credentials: CredentialsConfig{
@@ -157,38 +160,41 @@ func (c Config) RoleNames() []string {
 	return names
 }
 
-var (
-	globalConfig *Config
-	configMu     sync.RWMutex
-)
+// globalConfig holds the process-wide config. It is swapped atomically and
+// the pointee is never mutated in place, so readers need no lock.
+var globalConfig atomic.Pointer[Config]
 
 // Get returns the current config. If Init has not been called, returns
 // DefaultConfig.
 func Get() Config {
-	configMu.RLock()
-	defer configMu.RUnlock()
-	if c := globalConfig; c != nil {
+	if c := globalConfig.Load(); c != nil {
 		return c.clone()
 	}
 	return DefaultConfig()
 }
 
+// FetchTimeout returns the configured fetch timeout in seconds. Strategy
+// constructors call this on every fetch, so it reads the field directly
+// instead of cloning the whole config through Get.
+func FetchTimeout() float64 {
+	if c := globalConfig.Load(); c != nil {
+		return c.Fetch.Timeout
+	}
+	return defaultFetchTimeout
+}
+
 // Init loads config from disk and sets the global. Call once at startup.
 // Returns the loaded config and any config error (defaults are used on error).
 func Init() (Config, error) {
 	c, err := Load("")
-	configMu.Lock()
-	defer configMu.Unlock()
-	globalConfig = &c
+	globalConfig.Store(&c)
 	return c.clone(), err
 }
 
 // SetGlobal replaces the global config value. Use after persisting config
 // changes to disk so in-process reads reflect the update.
 func SetGlobal(cfg Config) {
-	configMu.Lock()
-	defer configMu.Unlock()
-	globalConfig = &cfg
+	globalConfig.Store(&cfg)
 }
 
 func Load(path string) (Config, error) {
@@ -23,9 +23,7 @@ func setupTempDir(t *testing.T) string {
 	t.Setenv("VIBEUSAGE_DATA_DIR", filepath.Join(dir, "data"))
 	t.Setenv("VIBEUSAGE_CACHE_DIR", filepath.Join(dir, "cache"))
 	// Reset global config so tests don't leak state.
-	configMu.Lock()
-	globalConfig = nil
-	configMu.Unlock()
+	globalConfig.Store(nil)
 	return dir
 }
 
@@ -46,9 +44,7 @@ func setupTempDirWithCredentialIsolation(t *testing.T) string {
 	}
 
 	// Reset global config again so it picks up the new file
-	configMu.Lock()
-	globalConfig = nil
-	configMu.Unlock()
+	globalConfig.Store(nil)
 
 	return dir
 }
@@ -518,6 +514,21 @@ func TestGet_ReturnsDefaultWhenNotInitialized(t *testing.T) {
 	}
 }
 
+func TestFetchTimeout(t *testing.T) {
+	setupTempDir(t) // clears global
+
+	if got, want := FetchTimeout(), DefaultConfig().Fetch.Timeout; got != want {
+		t.Errorf("FetchTimeout() without Init = %v, want %v", got, want)
+	}
+
+	cfg := DefaultConfig()
+	cfg.Fetch.Timeout = 12.5
+	Override(t, cfg)
+	if got := FetchTimeout(); got != 12.5 {
+		t.Errorf("FetchTimeout() = %v, want 12.5", got)
+	}
+}
+
 func TestInit_LoadsFromFile(t *testing.T) {
 	dir := setupTempDir(t)
 	path := filepath.Join(dir, "config", "config.toml")
@@ -665,9 +676,7 @@ func TestRoles_CloneIsolation(t *testing.T) {
 	cfg := DefaultConfig()
 	cfg.Roles["test"] = RoleConfig{Models: []string{"model-a", "model-b"}}
 
-	configMu.Lock()
-	globalConfig = &cfg
-	configMu.Unlock()
+	globalConfig.Store(&cfg)
 
 	c1 := Get()
 	c1.Roles["test"] = RoleConfig{Models: []string{"MUTATED"}}
@@ -1856,9 +1865,7 @@ func TestCacheSnapshot_ErrorWrapping(t *testing.T) {
 		t.Fatalf("setup blocking file: %v", err)
 	}
 	t.Setenv("VIBEUSAGE_CACHE_DIR", filepath.Join(blockingFile, "impossible"))
-	configMu.Lock()
-	globalConfig = nil
-	configMu.Unlock()
+	globalConfig.Store(nil)
 
 	snap := models.UsageSnapshot{Provider: "test"}
 	err := CacheSnapshot(snap)
@@ -1876,9 +1883,7 @@ func TestCacheOrgID_ErrorWrapping(t *testing.T) {
 		t.Fatalf("setup blocking file: %v", err)
 	}
 	t.Setenv("VIBEUSAGE_CACHE_DIR", filepath.Join(blockingFile, "impossible"))
-	configMu.Lock()
-	globalConfig = nil
-	configMu.Unlock()
+	globalConfig.Store(nil)
 
 	err := CacheOrgID("test", "org-123")
 	if err == nil {
@@ -1905,9 +1910,7 @@ func TestWriteCredential_ErrorWrapping_ReadOnly(t *testing.T) {
 	t.Cleanup(func() { _ = os.Chmod(readonlyDir, 0o755) })
 
 	t.Setenv("VIBEUSAGE_DATA_DIR", readonlyDir)
-	configMu.Lock()
-	globalConfig = nil
-	configMu.Unlock()
+	globalConfig.Store(nil)
 
 	err := WriteCredential("testprov", "oauth", []byte(`{"data":"x"}`))
 	if err == nil {
@@ -1918,63 +1921,62 @@ func TestWriteCredential_ErrorWrapping_ReadOnly(t *testing.T) {
 	}
 }
 
-func TestSaveAndLoadThrottle(t *testing.T) {
-	setupTempDir(t)
-
-	retryAt := time.Now().Add(5 * time.Minute).UTC().Truncate(time.Second)
-	marker := fetch.ThrottleMarker{
-		RetryAt: retryAt,
-		Reason:  "Rate limited by provider",
-	}
-
-	if err := SaveThrottle("claude", marker); err != nil {
-		t.Fatalf("SaveThrottle error: %v", err)
-	}
-
-	loaded, err := LoadThrottle("claude")
-	if err != nil {
-		t.Fatalf("LoadThrottle error: %v", err)
-	}
-	if loaded == nil {
-		t.Fatal("expected throttle marker to load")
-	}
-	if !loaded.RetryAt.Equal(retryAt) {
-		t.Errorf("RetryAt = %v, want %v", loaded.RetryAt, retryAt)
-	}
-	if loaded.Reason != marker.Reason {
-		t.Errorf("Reason = %q, want %q", loaded.Reason, marker.Reason)
-	}
-}
-
-func TestLoadThrottle_ExpiredIsDeleted(t *testing.T) {
-	setupTempDir(t)
-
-	past := time.Now().Add(-1 * time.Minute).UTC()
-	if err := SaveThrottle("claude", fetch.ThrottleMarker{RetryAt: past, Reason: "old"}); err != nil {
-		t.Fatalf("SaveThrottle error: %v", err)
+func TestLoadThrottle(t *testing.T) {
+	now := time.Now().UTC().Truncate(time.Second)
+	tests := []struct {
+		name       string
+		saved      *fetch.ThrottleMarker
+		wantMarker bool
+		wantFile   bool
+	}{
+		{
+			name:       "active marker loads",
+			saved:      &fetch.ThrottleMarker{RetryAt: now.Add(5 * time.Minute), Reason: "Rate limited by provider"},
+			wantMarker: true,
+			wantFile:   true,
+		},
+		{
+			name:  "expired marker is deleted",
+			saved: &fetch.ThrottleMarker{RetryAt: now.Add(-1 * time.Minute), Reason: "old"},
+		},
+		{
+			name: "missing marker returns nil",
+		},
 	}
 
-	m, err := LoadThrottle("claude")
-	if err != nil {
-		t.Fatalf("LoadThrottle error: %v", err)
-	}
-	if m != nil {
-		t.Errorf("expected nil for expired marker, got %+v", m)
-	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			setupTempDir(t)
+			if tt.saved != nil {
+				if err := SaveThrottle("claude", *tt.saved); err != nil {
+					t.Fatalf("SaveThrottle error: %v", err)
+				}
+			}
 
-	if _, err := os.Stat(ThrottlePath("claude")); !os.IsNotExist(err) {
-		t.Error("expected expired throttle file to be removed on load")
-	}
-}
+			loaded, err := LoadThrottle("claude")
+			if err != nil {
+				t.Fatalf("LoadThrottle error: %v", err)
+			}
+			if !tt.wantMarker {
+				if loaded != nil {
+					t.Errorf("LoadThrottle() = %+v, want nil", loaded)
+				}
+			} else if loaded == nil {
+				t.Fatal("expected throttle marker to load")
+			} else {
+				if !loaded.RetryAt.Equal(tt.saved.RetryAt) {
+					t.Errorf("RetryAt = %v, want %v", loaded.RetryAt, tt.saved.RetryAt)
+				}
+				if loaded.Reason != tt.saved.Reason {
+					t.Errorf("Reason = %q, want %q", loaded.Reason, tt.saved.Reason)
+				}
+			}
 
-func TestLoadThrottle_MissingReturnsNil(t *testing.T) {
-	setupTempDir(t)
-	m, err := LoadThrottle("claude")
-	if err != nil {
-		t.Fatalf("LoadThrottle error: %v", err)
-	}
-	if m != nil {
-		t.Errorf("expected nil for missing marker, got %+v", m)
+			_, statErr := os.Stat(ThrottlePath("claude"))
+			if exists := statErr == nil; exists != tt.wantFile {
+				t.Errorf("throttle file exists = %v, want %v", exists, tt.wantFile)
+			}
+		})
 	}
 }
 
@@ -7,14 +7,8 @@ import "testing"
 // config files to disk and call Init in tests.
 func Override(t testing.TB, cfg Config) {
 	t.Helper()
-	configMu.RLock()
-	prev := globalConfig
-	configMu.RUnlock()
+	prev := globalConfig.Load()
 
 	SetGlobal(cfg)
-	t.Cleanup(func() {
-		configMu.Lock()
-		defer configMu.Unlock()
-		globalConfig = prev
-	})
+	t.Cleanup(func() { globalConfig.Store(prev) })
 }
@@ -2,6 +2,7 @@ package display
 
 import (
 	"fmt"
+	"strconv"
 	"strings"
 	"time"
 
@@ -35,9 +36,23 @@ func colorStyle(color string) lipgloss.Style {
 }
 
 func RenderBar(utilization int, width int, color string) string {
-	filled := max(0, min(utilization*width/100, width))
-	bar := strings.Repeat("█", filled) + strings.Repeat("░", width-filled)
-	return colorStyle(color).Render(bar)
+	return colorStyle(color).Render(barText(utilization*width/100, width))
+}
+
+// barText returns width bar glyphs with the first filled of them solid,
+// clamping filled to [0, width]. The result is built in one allocation.
+func barText(filled int, width int) string {
+	filled = max(0, min(filled, width))
+	var b strings.Builder
+	b.Grow(width * len("█"))
+	for i := range width {
+		if i < filled {
+			b.WriteString("█")
+		} else {
+			b.WriteString("░")
+		}
+	}
+	return b.String()
 }
 
 // periodTableRow represents one period entry for the table builder.
@@ -51,17 +66,17 @@ type periodTableRow struct {
 // Count-based periods show "used / limit"; percentage periods show "N%".
 func formatPeriodValue(p models.UsagePeriod) string {
 	if p.IsCountBased() {
-		return fmt.Sprintf("%d / %d", *p.Used, *p.Limit)
+		return strconv.Itoa(*p.Used) + " / " + strconv.Itoa(*p.Limit)
 	}
-	return fmt.Sprintf("%d%%", p.Utilization)
+	return strconv.Itoa(p.Utilization) + "%"
 }
 
-func formatRecoveryHint(p models.UsagePeriod, level pace.Level, indent int) string {
+func formatRecoveryHint(p models.UsagePeriod, level pace.Level, indent int, now time.Time) string {
 	if p.IsCountBased() || level != pace.Critical {
 		return ""
 	}
-	reset := p.TimeUntilReset()
-	elapsed := p.ElapsedRatio()
+	reset := p.TimeUntilResetAt(now)
+	elapsed := p.ElapsedRatioAt(now)
 	if reset == nil || elapsed == nil {
 		return ""
 	}
@@ -136,10 +151,17 @@ func formatOverageLine(o *models.OverageUsage, label string) string {
 	if o.Currency == "USD" {
 		sym = "$"
 	}
+	used := formatAmount(sym, o.Used)
 	if o.Limit > 0 {
-		return fmt.Sprintf("%s: %s%.2f / %s%.2f %s", label, sym, o.Used, sym, o.Limit, o.Currency)
+		return label + ": " + used + " / " + formatAmount(sym, o.Limit) + " " + o.Currency
 	}
-	return fmt.Sprintf("%s: %s%.2f %s (Unlimited)", label, sym, o.Used, o.Currency)
+	return label + ": " + used + " " + o.Currency + " (Unlimited)"
+}
+
+// formatAmount renders a currency amount with two decimal places after the
+// given symbol, matching the %.2f verb without going through fmt.
+func formatAmount(sym string, amount float64) string {
+	return sym + strconv.FormatFloat(amount, 'f', 2, 64)
 }
 
 // formatBalance renders a standalone balance line from billing detail.
@@ -150,9 +172,9 @@ func formatBalance(billing *models.BillingDetail) string {
 	}
 	bal := *billing.Balance
 	if bal < 0 {
-		return fmt.Sprintf("Balance: -$%.2f", -bal)
+		return "Balance: -" + formatAmount("$", -bal)
 	}
-	return fmt.Sprintf("Balance: $%.2f", bal)
+	return "Balance: " + formatAmount("$", bal)
 }
 
 func formatResetCount(resets *models.UsageLimitResets) string {
@@ -165,7 +187,7 @@ func formatResetCount(resets *models.UsageLimitResets) string {
 	return fmt.Sprintf("%d resets", resets.AvailableCount)
 }
 
-func renderResetsPanel(resets *models.UsageLimitResets) string {
+func renderResetsPanel(resets *models.UsageLimitResets, now time.Time) string {
 	if resets == nil {
 		return ""
 	}
@@ -178,7 +200,6 @@ func renderResetsPanel(resets *models.UsageLimitResets) string {
 		color  string
 	}
 
-	now := time.Now()
 	dayWidth := max(resetExpiryDayWidth(resets.Resets, now), resetActivityDayWidth(resets.Activity, now))
 	leftWidth := lipgloss.Width("Type")
 	timeWidth := lipgloss.Width("Expires")
@@ -387,14 +408,8 @@ func formatBillingDetail(snapshot models.UsageSnapshot) string {
 	}
 
 	if snapshot.Billing != nil {
-		if snapshot.Billing.Balance != nil {
-			sym := "$"
-			bal := *snapshot.Billing.Balance
-			if bal < 0 {
-				parts = append(parts, fmt.Sprintf("Balance: -%s%.2f", sym, -bal))
-			} else {
-				parts = append(parts, fmt.Sprintf("Balance: %s%.2f", sym, bal))
-			}
+		if bal := formatBalance(snapshot.Billing); bal != "" {
+			parts = append(parts, bal)
 		}
 		if snapshot.Billing.AutoReload != nil {
 			status := "Off"
@@ -421,11 +436,12 @@ type DetailOptions struct {
 // with a provider title above a "Usage" panel, plus optional status info.
 func RenderSingleProvider(snapshot models.UsageSnapshot, cached bool, opts DetailOptions) string {
 	var out strings.Builder
+	now := time.Now()
 
 	// Provider title
 	providerTitle := titleStyle.Render(provider.DisplayName(snapshot.Provider))
 	if cached {
-		providerTitle += dimStyle.Render(" (" + formatAge(time.Since(snapshot.FetchedAt)) + " ago)")
+		providerTitle += dimStyle.Render(" (" + formatAge(now.Sub(snapshot.FetchedAt)) + " ago)")
 	}
 	out.WriteString(providerTitle)
 	out.WriteByte('\n')
@@ -445,9 +461,9 @@ func RenderSingleProvider(snapshot models.UsageSnapshot, cached bool, opts Detai
 
 	// Usage panel
 	out.WriteByte('\n')
-	out.WriteString(renderUsagePanel(snapshot))
+	out.WriteString(renderUsagePanel(snapshot, now))
 
-	if resetsPanel := renderResetsPanel(snapshot.UsageLimitResets); resetsPanel != "" {
+	if resetsPanel := renderResetsPanel(snapshot.UsageLimitResets, now); resetsPanel != "" {
 		out.WriteString("\n\n")
 		out.WriteString(resetsPanel)
 	}
@@ -528,8 +544,9 @@ func renderStatusLine(status models.ProviderStatus) string {
 	return line
 }
 
-// renderUsagePanel renders the usage data inside a titled "Usage" panel.
-func renderUsagePanel(snapshot models.UsageSnapshot) string {
+// renderUsagePanel renders the usage data inside a titled "Usage" panel,
+// evaluating every period's pace and countdown at now.
+func renderUsagePanel(snapshot models.UsageSnapshot, now time.Time) string {
 	var b strings.Builder
 
 	// Group periods
@@ -547,8 +564,8 @@ func renderUsagePanel(snapshot models.UsageSnapshot) string {
 		longerRows = append(longerRows, periodTableRow{name, p})
 	}
 
-	cw := PeriodColWidthsForRows(append(sessionRows, longerRows...))
-	tableOptions := periodTableOptions{widths: cw, recoveryHints: true}
+	cw := PeriodColWidthsForRows(append(sessionRows, longerRows...), now)
+	tableOptions := periodTableOptions{widths: cw, recoveryHints: true, now: now}
 
 	// Session periods
 	if len(sessionRows) > 0 {
@@ -598,23 +615,25 @@ func (cw PeriodColWidths) RowWidth() int {
 
 // GlobalPeriodColWidths computes the widest values for each column across all
 // provided snapshots, using the same name normalisations as RenderProviderPanel.
-func GlobalPeriodColWidths(snapshots []models.UsageSnapshot) PeriodColWidths {
+// Pass the same now to RenderProviderPanel so countdowns match their widths.
+func GlobalPeriodColWidths(snapshots []models.UsageSnapshot, now time.Time) PeriodColWidths {
 	var rows []periodTableRow
 	for _, s := range snapshots {
 		for _, p := range collectDisplayPeriods(s) {
 			rows = append(rows, periodTableRow{p.Name, p})
 		}
 	}
-	return PeriodColWidthsForRows(rows)
+	return PeriodColWidthsForRows(rows, now)
 }
 
-// PeriodColWidthsForRows computes the widest values for each table column.
-func PeriodColWidthsForRows(rows []periodTableRow) PeriodColWidths {
+// PeriodColWidthsForRows computes the widest values for each table column,
+// sizing reset countdowns as they read at now.
+func PeriodColWidthsForRows(rows []periodTableRow, now time.Time) PeriodColWidths {
 	var cw PeriodColWidths
 	for _, r := range rows {
 		cw.Name = max(cw.Name, lipgloss.Width(r.displayName))
 		cw.Pct = max(cw.Pct, lipgloss.Width(formatPeriodValue(r.period)))
-		if d := r.period.TimeUntilReset(); d != nil {
+		if d := r.period.TimeUntilResetAt(now); d != nil {
 			cw.Reset = max(cw.Reset, lipgloss.Width("resets in "+FormatResetCountdown(d)))
 		}
 	}
@@ -754,17 +773,19 @@ func isGenericPeriodName(name string) bool {
 
 // renderPeriodTable renders a slice of periods as a borderless table,
 // using shared column widths for consistent cross-panel alignment.
-func renderPeriodTable(periods []models.UsagePeriod, cw PeriodColWidths) string {
+func renderPeriodTable(periods []models.UsagePeriod, cw PeriodColWidths, now time.Time) string {
 	var rows []periodTableRow
 	for _, p := range periods {
 		rows = append(rows, periodTableRow{p.Name, p})
 	}
-	return buildPeriodTableWithOptions(rows, periodTableOptions{widths: cw})
+	return buildPeriodTableWithOptions(rows, periodTableOptions{widths: cw, now: now})
 }
 
 type periodTableOptions struct {
 	widths        PeriodColWidths
 	recoveryHints bool
+	// now is the instant every row's pace and countdown are evaluated at.
+	now time.Time
 }
 
 // buildPeriodTableWithOptions builds a period table with explicit column widths.
@@ -790,16 +811,17 @@ func buildPeriodTableWithOptions(rows []periodTableRow, opts periodTableOptions)
 		return lipgloss.NewStyle()
 	}
 
+	now := opts.now
 	var lines []string
 	for _, r := range rows {
 		p := r.period
-		level := pace.Assess(p.PaceRatio(), p.Utilization, p.ElapsedRatio())
+		level := pace.Assess(p.PaceRatioAt(now), p.Utilization, p.ElapsedRatioAt(now))
 		color := level.Color()
 		pct := colorStyle(color).Render(formatPeriodValue(p))
 		bar := RenderBar(p.Utilization, 20, color)
 
 		reset := ""
-		if d := p.TimeUntilReset(); d != nil {
+		if d := p.TimeUntilResetAt(now); d != nil {
 			reset = "resets in " + FormatResetCountdown(d)
 		}
 
@@ -809,7 +831,7 @@ func buildPeriodTableWithOptions(rows []periodTableRow, opts periodTableOptions)
 			Row(r.displayName, bar, pct, reset)
 		lines = append(lines, cleanPeriodTableOutput(t.Render()))
 		if opts.recoveryHints {
-			if recovery := formatRecoveryHint(p, level, 4); recovery != "" {
+			if recovery := formatRecoveryHint(p, level, 4, now); recovery != "" {
 				lines = append(lines, recovery)
 			}
 		}
@@ -819,11 +841,12 @@ func buildPeriodTableWithOptions(rows []periodTableRow, opts periodTableOptions)
 }
 
 // RenderProviderPanel renders a provider in compact panel format for multi-provider view.
-// Pass column widths from GlobalPeriodColWidths so all panels share identical column sizing.
-func RenderProviderPanel(snapshot models.UsageSnapshot, cached bool, cw PeriodColWidths) string {
+// Pass column widths from GlobalPeriodColWidths so all panels share identical column sizing,
+// and the now those widths were computed at.
+func RenderProviderPanel(snapshot models.UsageSnapshot, cached bool, cw PeriodColWidths, now time.Time) string {
 	var b strings.Builder
 
-	b.WriteString(renderPeriodTable(collectDisplayPeriods(snapshot), cw))
+	b.WriteString(renderPeriodTable(collectDisplayPeriods(snapshot), cw, now))
 
 	if snapshot.Overage != nil && snapshot.Overage.IsEnabled {
 		b.WriteByte('\n')
@@ -837,7 +860,7 @@ func RenderProviderPanel(snapshot models.UsageSnapshot, cached bool, cw PeriodCo
 
 	title := titleStyle.Render(provider.DisplayName(snapshot.Provider))
 	if cached {
-		title += dimStyle.Render(" (" + formatAge(time.Since(snapshot.FetchedAt)) + " ago)")
+		title += dimStyle.Render(" (" + formatAge(now.Sub(snapshot.FetchedAt)) + " ago)")
 	}
 	return renderTitledPanel(title, formatResetCount(snapshot.UsageLimitResets), b.String(), cw.RowWidth())
 }
@@ -872,11 +895,13 @@ func renderTitledPanel(title string, badge string, body string, minWidth int) st
 	}
 	bottom := separatorStyle.Render("╰" + strings.Repeat("─", innerWidth) + "╯")
 
+	// The side border is identical on every row, so style it once per panel.
+	side := separatorStyle.Render("│")
 	rows := make([]string, 0, len(lines)+2)
 	rows = append(rows, top)
 	for _, line := range lines {
 		pad := strings.Repeat(" ", max(0, bodyWidth-lipgloss.Width(line)))
-		rows = append(rows, separatorStyle.Render("│")+" "+line+pad+" "+separatorStyle.Render("│"))
+		rows = append(rows, side+" "+line+pad+" "+side)
 	}
 	rows = append(rows, bottom)
 
@@ -5,7 +5,6 @@ import (
 	"strings"
 	"testing"
 	"time"
-	"unicode/utf8"
 
 	"github.com/charmbracelet/lipgloss"
 	"github.com/joshuadavidthomas/vibeusage/internal/models"
@@ -92,16 +91,10 @@ func TestRenderBar_Boundaries(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			result := RenderBar(tt.utilization, tt.width, "")
-			// Count filled and empty runes (no color = plain text)
-			filled := strings.Count(result, "█")
-			empty := strings.Count(result, "░")
-
-			if filled != tt.wantFilled {
-				t.Errorf("filled blocks = %d, want %d", filled, tt.wantFilled)
-			}
-			if empty != tt.wantEmpty {
-				t.Errorf("empty blocks = %d, want %d", empty, tt.wantEmpty)
+			// No color means plain text, so the bar can be compared whole.
+			want := strings.Repeat("█", tt.wantFilled) + strings.Repeat("░", tt.wantEmpty)
+			if got := RenderBar(tt.utilization, tt.width, ""); got != want {
+				t.Errorf("RenderBar(%d, %d) = %q, want %q", tt.utilization, tt.width, got, want)
 			}
 		})
 	}
@@ -445,13 +438,20 @@ func TestRenderSingleProvider_NoAgeIndicatorWhenFresh(t *testing.T) {
 
 // RenderProviderPanel tests
 
+// renderSoloPanel renders snap as the only panel on screen, sizing its
+// period columns from the snapshot itself.
+func renderSoloPanel(snap models.UsageSnapshot, cached bool) string {
+	now := time.Now()
+	return RenderProviderPanel(snap, cached, GlobalPeriodColWidths([]models.UsageSnapshot{snap}, now), now)
+}
+
 func TestRenderProviderPanel_ContainsProviderTitle(t *testing.T) {
 	snap := models.UsageSnapshot{
 		Provider: "copilot",
 		Periods:  []models.UsagePeriod{{Name: "Monthly", Utilization: 60, PeriodType: models.PeriodMonthly}},
 	}
 
-	result := RenderProviderPanel(snap, false, GlobalPeriodColWidths([]models.UsageSnapshot{snap}))
+	result := renderSoloPanel(snap, false)
 	if !strings.Contains(result, "Copilot") {
 		t.Errorf("expected title-cased provider name 'Copilot', got: %q", result)
 	}
@@ -463,7 +463,7 @@ func TestRenderProviderPanel_HasBorder(t *testing.T) {
 		Periods:  []models.UsagePeriod{{Name: "Monthly", Utilization: 50, PeriodType: models.PeriodMonthly}},
 	}
 
-	result := RenderProviderPanel(snap, false, GlobalPeriodColWidths([]models.UsageSnapshot{snap}))
+	result := renderSoloPanel(snap, false)
 	// Rounded border characters
 	if !strings.Contains(result, "╭") || !strings.Contains(result, "╰") {
 		t.Errorf("expected rounded border characters, got: %q", result)
@@ -479,7 +479,7 @@ func TestRenderProviderPanel_FiltersModelSpecificPeriods(t *testing.T) {
 		},
 	}
 
-	result := RenderProviderPanel(snap, false, GlobalPeriodColWidths([]models.UsageSnapshot{snap}))
+	result := renderSoloPanel(snap, false)
 	if !strings.Contains(result, "50%") {
 		t.Errorf("expected general period '50%%', got: %q", result)
 	}
@@ -498,7 +498,7 @@ func TestRenderProviderPanel_RenamesWeeklyDaily(t *testing.T) {
 		},
 	}
 
-	result := RenderProviderPanel(snap, false, GlobalPeriodColWidths([]models.UsageSnapshot{snap}))
+	result := renderSoloPanel(snap, false)
 	// Names without parentheses should be normalized
 	if !strings.Contains(result, "Weekly") {
 		t.Errorf("expected 'Weekly' label for weekly period, got: %q", result)
@@ -516,7 +516,7 @@ func TestRenderProviderPanel_PreservesBrandedName(t *testing.T) {
 		},
 	}
 
-	result := stripANSI(RenderProviderPanel(snap, false, GlobalPeriodColWidths([]models.UsageSnapshot{snap})))
+	result := stripANSI(renderSoloPanel(snap, false))
 	if !strings.Contains(result, "Amp Free") {
 		t.Errorf("expected branded name 'Amp Free' preserved, got: %q", result)
 	}
@@ -537,7 +537,7 @@ func TestRenderProviderPanel_WithOverage(t *testing.T) {
 		},
 	}
 
-	result := RenderProviderPanel(snap, false, GlobalPeriodColWidths([]models.UsageSnapshot{snap}))
+	result := renderSoloPanel(snap, false)
 	if !strings.Contains(result, "Extra:") {
 		t.Errorf("expected compact 'Extra:' format for overage, got: %q", result)
 	}
@@ -553,7 +553,7 @@ func TestRenderProviderPanel_ResetCount(t *testing.T) {
 		UsageLimitResets: &models.UsageLimitResets{AvailableCount: 2},
 	}
 
-	result := stripANSI(RenderProviderPanel(snap, false, GlobalPeriodColWidths([]models.UsageSnapshot{snap})))
+	result := stripANSI(renderSoloPanel(snap, false))
 	lines := strings.Split(result, "\n")
 	if !strings.Contains(lines[0], "2 resets") {
 		t.Errorf("expected reset count in top border, got: %q", result)
@@ -572,7 +572,7 @@ func TestRenderProviderPanel_OneResetUsesSingular(t *testing.T) {
 		UsageLimitResets: &models.UsageLimitResets{AvailableCount: 1},
 	}
 
-	result := stripANSI(RenderProviderPanel(snap, false, GlobalPeriodColWidths([]models.UsageSnapshot{snap})))
+	result := stripANSI(renderSoloPanel(snap, false))
 	if !strings.Contains(result, "1 reset") || strings.Contains(result, "1 resets") {
 		t.Errorf("expected singular reset count, got: %q", result)
 	}
@@ -585,7 +585,7 @@ func TestRenderProviderPanel_AgeIndicator(t *testing.T) {
 		Periods:   []models.UsagePeriod{{Name: "Monthly", Utilization: 50, PeriodType: models.PeriodMonthly}},
 	}
 
-	result := RenderProviderPanel(snap, true, GlobalPeriodColWidths([]models.UsageSnapshot{snap}))
+	result := renderSoloPanel(snap, true)
 	if !strings.Contains(result, "3h ago") {
 		t.Errorf("expected '3h ago' in panel title, got: %q", result)
 	}
@@ -598,7 +598,7 @@ func TestRenderProviderPanel_NoAgeIndicatorWhenFresh(t *testing.T) {
 		Periods:   []models.UsagePeriod{{Name: "Monthly", Utilization: 50, PeriodType: models.PeriodMonthly}},
 	}
 
-	result := RenderProviderPanel(snap, false, GlobalPeriodColWidths([]models.UsageSnapshot{snap}))
+	result := renderSoloPanel(snap, false)
 	if strings.Contains(result, "ago") {
 		t.Errorf("should not show age indicator for fresh data, got: %q", result)
 	}
@@ -671,69 +671,61 @@ func TestPickLonger_Priority(t *testing.T) {
 
 // colorStyle tests (internal)
 
-func TestColorStyle_ValidColors(t *testing.T) {
-	for _, color := range []string{"green", "yellow", "red"} {
-		style := colorStyle(color)
-		rendered := style.Render("test")
-		if rendered == "" {
-			t.Errorf("colorStyle(%q).Render should produce non-empty output", color)
-		}
-	}
-}
-
-func TestColorStyle_UnknownColor(t *testing.T) {
-	style := colorStyle("purple")
-	rendered := style.Render("test")
-	// Unknown color returns unstyled, should still contain the text
-	if !strings.Contains(rendered, "test") {
-		t.Errorf("colorStyle(unknown) should still render text, got: %q", rendered)
-	}
-}
-
-func TestColorStyle_EmptyColor(t *testing.T) {
-	style := colorStyle("")
-	rendered := style.Render("test")
-	runeCount := utf8.RuneCountInString(rendered)
-	if runeCount < 4 {
-		t.Errorf("colorStyle('').Render('test') should have at least 4 runes, got %d", runeCount)
+func TestColorStyle_RendersText(t *testing.T) {
+	// Known colors are styled; unknown and empty colors fall back to an
+	// unstyled render. Either way the text itself must survive.
+	for _, color := range []string{"green", "yellow", "red", "purple", ""} {
+		t.Run(color, func(t *testing.T) {
+			rendered := colorStyle(color).Render("test")
+			if !strings.Contains(rendered, "test") {
+				t.Errorf("colorStyle(%q).Render(\"test\") = %q, want it to contain the text", color, rendered)
+			}
+		})
 	}
 }
 
 // Overage formatting tests
 
-func TestFormatOverageLine_WithLimit(t *testing.T) {
-	o := &models.OverageUsage{Used: 5.50, Limit: 100.00, Currency: "USD", IsEnabled: true}
-	got := formatOverageLine(o, "Extra Usage")
-	if got != "Extra Usage: $5.50 / $100.00 USD" {
-		t.Errorf("formatOverageLine with limit = %q, want %q", got, "Extra Usage: $5.50 / $100.00 USD")
-	}
-}
-
-func TestFormatOverageLine_ZeroLimit(t *testing.T) {
-	o := &models.OverageUsage{Used: 73.72, Limit: 0.00, Currency: "USD", IsEnabled: true}
-	got := formatOverageLine(o, "Extra Usage")
-	want := "Extra Usage: $73.72 USD (Unlimited)"
-	if got != want {
-		t.Errorf("formatOverageLine with zero limit = %q, want %q", got, want)
-	}
-	if strings.Contains(got, "/ $0.00") {
-		t.Error("zero limit should not show '/ $0.00'")
-	}
-}
-
-func TestFormatOverageLine_NonUSDCurrency(t *testing.T) {
-	o := &models.OverageUsage{Used: 10.00, Limit: 50.00, Currency: "EUR", IsEnabled: true}
-	got := formatOverageLine(o, "Extra")
-	if got != "Extra: 10.00 / 50.00 EUR" {
-		t.Errorf("formatOverageLine non-USD = %q, want %q", got, "Extra: 10.00 / 50.00 EUR")
+func TestFormatOverageLine(t *testing.T) {
+	tests := []struct {
+		name    string
+		overage models.OverageUsage
+		label   string
+		want    string
+	}{
+		{
+			name:    "with limit",
+			overage: models.OverageUsage{Used: 5.50, Limit: 100.00, Currency: "USD", IsEnabled: true},
+			label:   "Extra Usage",
+			want:    "Extra Usage: $5.50 / $100.00 USD",
+		},
+		{
+			// A zero limit means no cap, so no "/ $0.00" is shown.
+			name:    "zero limit",
+			overage: models.OverageUsage{Used: 73.72, Limit: 0.00, Currency: "USD", IsEnabled: true},
+			label:   "Extra Usage",
+			want:    "Extra Usage: $73.72 USD (Unlimited)",
+		},
+		{
+			name:    "non-USD currency",
+			overage: models.OverageUsage{Used: 10.00, Limit: 50.00, Currency: "EUR", IsEnabled: true},
+			label:   "Extra",
+			want:    "Extra: 10.00 / 50.00 EUR",
+		},
+		{
+			name:    "zero used",
+			overage: models.OverageUsage{Used: 0.00, Limit: 100.00, Currency: "USD", IsEnabled: true},
+			label:   "Extra",
+			want:    "Extra: $0.00 / $100.00 USD",
+		},
 	}
-}
 
-func TestFormatOverageLine_ZeroUsed(t *testing.T) {
-	o := &models.OverageUsage{Used: 0.00, Limit: 100.00, Currency: "USD", IsEnabled: true}
-	got := formatOverageLine(o, "Extra")
-	if got != "Extra: $0.00 / $100.00 USD" {
-		t.Errorf("formatOverageLine zero used = %q, want %q", got, "Extra: $0.00 / $100.00 USD")
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := formatOverageLine(&tt.overage, tt.label); got != tt.want {
+				t.Errorf("formatOverageLine() = %q, want %q", got, tt.want)
+			}
+		})
 	}
 }
 
@@ -763,7 +755,7 @@ func TestRenderProviderPanel_OverageZeroLimit(t *testing.T) {
 		Periods:  []models.UsagePeriod{{Name: "Monthly", Utilization: 90, PeriodType: models.PeriodMonthly}},
 		Overage:  &models.OverageUsage{Used: 73.72, Limit: 0.00, Currency: "USD", IsEnabled: true},
 	}
-	result := RenderProviderPanel(snap, false, GlobalPeriodColWidths([]models.UsageSnapshot{snap}))
+	result := renderSoloPanel(snap, false)
 	if strings.Contains(result, "/ $0.00") {
 		t.Errorf("should not show '/ $0.00' for zero limit overage, got: %q", result)
 	}
@@ -876,7 +868,7 @@ func TestRenderProviderPanel_BillingBalanceNoOverage(t *testing.T) {
 		Billing:  &models.BillingDetail{Balance: &bal},
 	}
 
-	result := stripANSI(RenderProviderPanel(snap, false, GlobalPeriodColWidths([]models.UsageSnapshot{snap})))
+	result := stripANSI(renderSoloPanel(snap, false))
 	if !strings.Contains(result, "Balance: $8.00") {
 		t.Errorf("expected balance line in panel, got: %q", result)
 	}
@@ -1010,11 +1002,11 @@ func TestRenderSingleProvider_DetailLayout_NoPeriods(t *testing.T) {
 	}
 
 	result := stripANSI(RenderSingleProvider(snap, false, DetailOptions{}))
-	lines := strings.Split(result, "\n")
 
 	// First line is provider title
-	if !strings.Contains(lines[0], "Claude") {
-		t.Errorf("first line should contain provider name, got: %q", lines[0])
+	firstLine, _, _ := strings.Cut(result, "\n")
+	if !strings.Contains(firstLine, "Claude") {
+		t.Errorf("first line should contain provider name, got: %q", firstLine)
 	}
 	// Should still have a Usage panel
 	if !strings.Contains(result, "Usage") {
@@ -1034,7 +1026,7 @@ func TestRenderProviderPanel_PanelLayout(t *testing.T) {
 		Overage: &models.OverageUsage{Used: 10.00, Limit: 50.00, Currency: "USD", IsEnabled: true},
 	}
 
-	result := stripANSI(RenderProviderPanel(snap, false, GlobalPeriodColWidths([]models.UsageSnapshot{snap})))
+	result := stripANSI(renderSoloPanel(snap, false))
 
 	lines := strings.Split(result, "\n")
 	if len(lines) < 3 {
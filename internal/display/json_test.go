@@ -18,24 +18,23 @@ func TestOutputJSON_WritesToWriter(t *testing.T) {
 		t.Fatalf("unexpected error: %v", err)
 	}
 
-	output := buf.String()
-	if !strings.Contains(output, `"key"`) {
-		t.Errorf("expected key in output, got: %s", output)
-	}
-	if !strings.Contains(output, `"value"`) {
-		t.Errorf("expected value in output, got: %s", output)
+	want := "{\n  \"key\": \"value\"\n}\n"
+	if got := buf.String(); got != want {
+		t.Errorf("output = %q, want %q", got, want)
 	}
 }
 
 func TestOutputJSON_PrettyPrints(t *testing.T) {
 	var buf bytes.Buffer
-	if err := OutputJSON(&buf, map[string]string{"a": "1"}); err != nil {
+	data := map[string]any{"outer": map[string]any{"inner": []int{1}}}
+	if err := OutputJSON(&buf, data); err != nil {
 		t.Fatalf("unexpected error: %v", err)
 	}
 
-	output := buf.String()
-	if !strings.Contains(output, "  ") {
-		t.Errorf("expected indented output, got: %s", output)
+	// Each nesting level adds two spaces of indentation.
+	want := "{\n  \"outer\": {\n    \"inner\": [\n      1\n    ]\n  }\n}\n"
+	if got := buf.String(); got != want {
+		t.Errorf("output = %q, want %q", got, want)
 	}
 }
 
@@ -3,6 +3,7 @@ package display
 import (
 	"fmt"
 	"sort"
+	"strconv"
 	"time"
 
 	"github.com/joshuadavidthomas/vibeusage/internal/pace"
@@ -138,8 +139,8 @@ func FormatMultiplier(m *float64) string {
 func formatCandidateRow(c routing.Candidate, hasMultiplier, includeModel bool, modelID string, renderBar RenderBarFunc, formatReset FormatResetFunc) []string {
 	name := provider.DisplayName(c.ProviderID)
 	bar := renderBar(c.Utilization)
-	util := fmt.Sprintf("%d%%", c.Utilization)
-	headroom := fmt.Sprintf("%d%%", c.EffectiveHeadroom)
+	util := strconv.Itoa(c.Utilization) + "%"
+	headroom := strconv.Itoa(c.EffectiveHeadroom) + "%"
 	cost := FormatMultiplier(c.Multiplier)
 
 	reset := ""
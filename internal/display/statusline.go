@@ -4,6 +4,7 @@ import (
 	"fmt"
 	"io"
 	"sort"
+	"strconv"
 	"strings"
 	"time"
 
@@ -61,6 +62,7 @@ func renderStatuslineTable(w io.Writer, outcomes map[string]fetch.FetchOutcome,
 	}
 	var rows []row
 	maxProviderWidth := 0
+	now := time.Now()
 
 	for _, pid := range ids {
 		outcome := outcomes[pid]
@@ -80,9 +82,9 @@ func renderStatuslineTable(w io.Writer, outcomes map[string]fetch.FetchOutcome,
 
 		for _, p := range periods {
 			utilization := min(p.Utilization, 100)
-			color := pace.Assess(p.PaceRatio(), p.Utilization, p.ElapsedRatio()).Color()
+			color := pace.Assess(p.PaceRatioAt(now), p.Utilization, p.ElapsedRatioAt(now)).Color()
 			qual, dur := periodNameParts(p)
-			timer := formatDurationCompact(p.TimeUntilReset())
+			timer := formatDurationCompact(p.TimeUntilResetAt(now))
 			if timer == "" {
 				timer = "-"
 			}
@@ -90,14 +92,12 @@ func renderStatuslineTable(w io.Writer, outcomes map[string]fetch.FetchOutcome,
 			col := periodColumn{
 				qualifier: qual,
 				duration:  dur,
-				pct:       fmt.Sprintf("%d%%", p.Utilization),
+				pct:       strconv.Itoa(p.Utilization) + "%",
 				timer:     timer,
 			}
 
 			if showBar {
-				filled := utilization * 10 / 100
-				bar := strings.Repeat("█", filled) + strings.Repeat("░", 10-filled)
-				col.bar = colorStyle(color).Render(bar)
+				col.bar = colorStyle(color).Render(barText(utilization*10/100, 10))
 				col.pct = colorStyle(color).Render(col.pct)
 			} else if !noColor {
 				col.pct = colorStyle(color).Render(col.pct)
@@ -17,6 +17,9 @@ func ExecutePipeline(ctx context.Context, providerID string, strategies []Strate
 	logger := logging.FromContext(ctx)
 	anyAttempted := false
 	lastErr := ""
+	// throttleAbsent records that the store was read and held no active
+	// marker, so a successful fetch has nothing to clear.
+	throttleAbsent := false
 
 	// Refuse to serve cache or fetch when the caller already cancelled;
 	// a canceled run must not report stale usage as success.
@@ -35,6 +38,8 @@ func ExecutePipeline(ctx context.Context, providerID string, strategies []Strate
 		if err != nil {
 			logger.Warn("loading throttle marker failed", "provider", providerID, "err", err)
 			marker = nil
+		} else if marker == nil {
+			throttleAbsent = true
 		}
 		if marker != nil {
 			if cfg.Cache != nil {
@@ -117,6 +122,7 @@ func ExecutePipeline(ctx context.Context, providerID string, strategies []Strate
 			if reason == "" {
 				reason = "Rate limited"
 			}
+			throttleAbsent = false
 			if err := cfg.Throttles.Save(providerID, ThrottleMarker{RetryAt: *result.RetryAfter, Reason: reason}); err != nil {
 				logger.Warn("saving throttle marker failed", "provider", providerID, "err", err)
 			}
@@ -142,7 +148,7 @@ func ExecutePipeline(ctx context.Context, providerID string, strategies []Strate
 					recordingError = err.Error()
 				}
 			}
-			if cfg.Throttles != nil {
+			if cfg.Throttles != nil && !throttleAbsent {
 				if err := cfg.Throttles.Clear(providerID); err != nil {
 					logger.Warn("clearing throttle marker failed", "provider", providerID, "err", err)
 				}
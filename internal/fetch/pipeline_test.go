@@ -96,6 +96,17 @@ func newMemThrottles() *memThrottles {
 	return &memThrottles{data: make(map[string]ThrottleMarker)}
 }
 
+// newThrottledMemThrottles returns a memThrottles holding an active marker
+// for test-provider with the given reason.
+func newThrottledMemThrottles(reason string) *memThrottles {
+	throttles := newMemThrottles()
+	throttles.data["test-provider"] = ThrottleMarker{
+		RetryAt: time.Now().Add(activeThrottleWindow),
+		Reason:  reason,
+	}
+	return throttles
+}
+
 func (t *memThrottles) Load(providerID string) (*ThrottleMarker, error) {
 	t.mu.Lock()
 	defer t.mu.Unlock()
@@ -144,6 +155,10 @@ func (t *cancelOnLoadThrottles) Load(providerID string) (*ThrottleMarker, error)
 	return marker, err
 }
 
+// activeThrottleWindow is how far in the future the throttle-marker tests
+// place RetryAt so the marker is still active when the pipeline runs.
+const activeThrottleWindow = 10 * time.Minute
+
 func defaultTestPipelineCfg() PipelineConfig {
 	return PipelineConfig{
 		Timeout: 30 * time.Second,
@@ -280,11 +295,7 @@ func TestExecutePipeline_CancelledDuringThrottleLoad(t *testing.T) {
 	ctx, cancel := context.WithCancel(context.Background())
 	defer cancel()
 
-	throttles := newMemThrottles()
-	throttles.data["test-provider"] = ThrottleMarker{
-		RetryAt: time.Now().Add(time.Hour),
-		Reason:  "Rate limited",
-	}
+	throttles := newThrottledMemThrottles("Rate limited")
 	strategy := &mockStrategy{
 		available: true,
 		fetchFn: func(context.Context) (FetchResult, error) {
@@ -307,8 +318,7 @@ func TestExecutePipeline_CancelledDuringThrottledCacheLoad(t *testing.T) {
 	ctx, cancel := context.WithCancel(context.Background())
 	defer cancel()
 
-	throttles := newMemThrottles()
-	throttles.data["test-provider"] = ThrottleMarker{RetryAt: time.Now().Add(time.Hour)}
+	throttles := newThrottledMemThrottles("")
 	cache := newMemCache()
 	cache.data["test-provider"] = testSnapshot("test-provider", "cached", 30)
 	strategy := &mockStrategy{
@@ -1451,11 +1461,7 @@ func TestExecutePipeline_ThrottleMarkerServesCacheWithoutFetch(t *testing.T) {
 		Source:    "previous-fetch",
 	}
 
-	throttles := newMemThrottles()
-	throttles.data["test-provider"] = ThrottleMarker{
-		RetryAt: time.Now().Add(10 * time.Minute),
-		Reason:  "Rate limited",
-	}
+	throttles := newThrottledMemThrottles("Rate limited")
 
 	fetchCalled := false
 	strategy := &mockStrategy{
@@ -1489,11 +1495,7 @@ func TestExecutePipeline_ThrottleMarkerServesCacheWithoutFetch(t *testing.T) {
 }
 
 func TestExecutePipeline_ThrottleMarkerNoCacheReturnsError(t *testing.T) {
-	throttles := newMemThrottles()
-	throttles.data["test-provider"] = ThrottleMarker{
-		RetryAt: time.Now().Add(10 * time.Minute),
-		Reason:  "Rate limited by Anthropic",
-	}
+	throttles := newThrottledMemThrottles("Rate limited by Anthropic")
 
 	fetchCalled := false
 	strategy := &mockStrategy{
@@ -1527,11 +1529,7 @@ func TestExecutePipeline_ThrottleMarkerNoCacheReturnsError(t *testing.T) {
 }
 
 func TestExecutePipeline_ThrottleMarkerBypassedWithNoCacheFlag(t *testing.T) {
-	throttles := newMemThrottles()
-	throttles.data["test-provider"] = ThrottleMarker{
-		RetryAt: time.Now().Add(10 * time.Minute),
-		Reason:  "Rate limited",
-	}
+	throttles := newThrottledMemThrottles("Rate limited")
 
 	fetchCalled := false
 	strategy := &mockStrategy{
@@ -1622,6 +1620,33 @@ func TestExecutePipeline_SuccessClearsThrottleMarker(t *testing.T) {
 	}
 }
 
+func TestExecutePipeline_SuccessSkipsClearWhenNoThrottleMarker(t *testing.T) {
+	throttles := newMemThrottles()
+	throttles.clearErr = errors.New("throttle clear failed")
+
+	strategy := &mockStrategy{
+		available: true,
+		fetchFn: func(context.Context) (FetchResult, error) {
+			return ResultOK(testSnapshot("test-provider", "mock", 33)), nil
+		},
+	}
+	ctx, logs := logging.NewTestContext(logging.Flags{NoColor: true})
+	cfg := PipelineConfig{
+		Timeout:   30 * time.Second,
+		Cache:     newMemCache(),
+		Throttles: throttles,
+	}
+
+	outcome := ExecutePipeline(ctx, "test-provider", []Strategy{strategy}, true, cfg)
+
+	if !outcome.Success {
+		t.Fatalf("expected success, got error: %s", outcome.Error)
+	}
+	if strings.Contains(logs.String(), "clearing throttle marker failed") {
+		t.Errorf("expected no throttle clear when no marker was loaded, got logs %q", logs.String())
+	}
+}
+
 func TestExecutePipeline_ExpiredThrottleMarkerIgnored(t *testing.T) {
 	throttles := newMemThrottles()
 	throttles.data["test-provider"] = ThrottleMarker{
@@ -128,11 +128,8 @@ func appendLocked(providerID string, snap models.UsageSnapshot) error {
 		}
 	}
 
-	for _, record := range records {
-		delta := snap.FetchedAt.Sub(record.Snapshot.FetchedAt)
-		if delta > -DedupFloor && delta < DedupFloor {
-			return nil
-		}
+	if hasRecordNear(records, snap.FetchedAt) {
+		return nil
 	}
 
 	data, err := json.Marshal(Record{V: CurrentRecordVersion, Snapshot: snap})
@@ -185,6 +182,18 @@ func appendLocked(providerID string, snap models.UsageSnapshot) error {
 	return nil
 }
 
+// hasRecordNear reports whether records, sorted oldest-first, contain a
+// snapshot fetched less than DedupFloor away from at. Because records are
+// sorted, only the first record after the window's lower bound can match, so
+// a binary search finds it without scanning the rest.
+func hasRecordNear(records []Record, at time.Time) bool {
+	lower := at.Add(-DedupFloor)
+	i := sort.Search(len(records), func(i int) bool {
+		return records[i].Snapshot.FetchedAt.After(lower)
+	})
+	return i < len(records) && records[i].Snapshot.FetchedAt.Before(at.Add(DedupFloor))
+}
+
 // Read returns valid history records in oldest-first order. Empty and malformed
 // lines are skipped so torn or interleaved appends do not make the history unreadable.
 func Read(providerID string) (records []Record, err error) {
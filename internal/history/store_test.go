@@ -162,6 +162,42 @@ func TestAppendDeduplicatesRecentHistory(t *testing.T) {
 	}
 }
 
+func TestHasRecordNear(t *testing.T) {
+	at := time.Date(2026, 1, 15, 12, 0, 0, 0, time.UTC)
+	records := make([]Record, 0, 100)
+	for i := 100; i > 0; i-- {
+		records = append(records, Record{
+			V:        CurrentRecordVersion,
+			Snapshot: testSnapshot("claude", "daily", at.Add(-time.Duration(i)*time.Hour)),
+		})
+	}
+
+	tests := []struct {
+		name string
+		at   time.Time
+		want bool
+	}{
+		{name: "empty window", at: at, want: false},
+		{name: "exact match", at: at.Add(-time.Hour), want: true},
+		{name: "just after record", at: at.Add(-time.Hour + DedupFloor - time.Nanosecond), want: true},
+		{name: "at floor after record", at: at.Add(-time.Hour + DedupFloor), want: false},
+		{name: "just before record", at: at.Add(-time.Hour - DedupFloor + time.Nanosecond), want: true},
+		{name: "at floor before record", at: at.Add(-time.Hour - DedupFloor), want: false},
+		{name: "before oldest", at: at.Add(-200 * time.Hour), want: false},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := hasRecordNear(records, tt.at); got != tt.want {
+				t.Errorf("hasRecordNear(%s) = %v, want %v", tt.at, got, tt.want)
+			}
+		})
+	}
+
+	if hasRecordNear(nil, at) {
+		t.Error("hasRecordNear(nil) = true, want false")
+	}
+}
+
 func TestAppendDeduplicatesConcurrentHistory(t *testing.T) {
 	t.Setenv("VIBEUSAGE_DATA_DIR", t.TempDir())
 
@@ -49,11 +49,12 @@ func (p UsagePeriod) Remaining() int {
 	return 100 - p.Utilization
 }
 
-func (p UsagePeriod) ElapsedRatio() *float64 {
+// ElapsedRatioAt returns how far through the period now is, from 0 to 1.
+// Callers pass the clock in so every period in one render shares an instant.
+func (p UsagePeriod) ElapsedRatioAt(now time.Time) *float64 {
 	if p.ResetsAt == nil {
 		return nil
 	}
-	now := time.Now()
 	totalHours := p.PeriodType.Hours()
 	startTime := p.ResetsAt.Add(-time.Duration(totalHours * float64(time.Hour)))
 	elapsed := now.Sub(startTime).Hours()
@@ -61,8 +62,9 @@ func (p UsagePeriod) ElapsedRatio() *float64 {
 	return &ratio
 }
 
-func (p UsagePeriod) PaceRatio() *float64 {
-	elapsed := p.ElapsedRatio()
+// PaceRatioAt compares utilization with elapsed time at now.
+func (p UsagePeriod) PaceRatioAt(now time.Time) *float64 {
+	elapsed := p.ElapsedRatioAt(now)
 	if elapsed == nil || *elapsed < 0.10 {
 		return nil
 	}
@@ -71,11 +73,12 @@ func (p UsagePeriod) PaceRatio() *float64 {
 	return &ratio
 }
 
-func (p UsagePeriod) TimeUntilReset() *time.Duration {
+// TimeUntilResetAt returns the time left before the period resets at now.
+func (p UsagePeriod) TimeUntilResetAt(now time.Time) *time.Duration {
 	if p.ResetsAt == nil {
 		return nil
 	}
-	d := time.Until(*p.ResetsAt)
+	d := p.ResetsAt.Sub(now)
 	if d < 0 {
 		d = 0
 	}
@@ -96,15 +96,18 @@ func TestOverageUsageUtilizationPct(t *testing.T) {
 	}
 }
 
-func TestElapsedRatio(t *testing.T) {
-	now := time.Now()
+// fixedNow is the clock reading the period ratio tests evaluate against, so
+// expected values are exact rather than bounded.
+var fixedNow = time.Date(2026, 1, 15, 12, 0, 0, 0, time.UTC)
+
+func TestElapsedRatioAt(t *testing.T) {
+	now := fixedNow
 
 	tests := []struct {
 		name    string
 		period  UsagePeriod
 		wantNil bool
-		wantMin float64
-		wantMax float64
+		want    float64
 	}{
 		{
 			name:    "nil reset returns nil",
@@ -117,8 +120,7 @@ func TestElapsedRatio(t *testing.T) {
 				PeriodType: PeriodDaily,
 				ResetsAt:   timePtr(now.Add(23 * time.Hour)),
 			},
-			wantMin: 0.0,
-			wantMax: 0.1,
+			want: 1.0 / 24,
 		},
 		{
 			name: "reset soon means late in period",
@@ -126,8 +128,7 @@ func TestElapsedRatio(t *testing.T) {
 				PeriodType: PeriodDaily,
 				ResetsAt:   timePtr(now.Add(1 * time.Hour)),
 			},
-			wantMin: 0.9,
-			wantMax: 1.0,
+			want: 23.0 / 24,
 		},
 		{
 			name: "reset at halfway",
@@ -135,8 +136,7 @@ func TestElapsedRatio(t *testing.T) {
 				PeriodType: PeriodDaily,
 				ResetsAt:   timePtr(now.Add(12 * time.Hour)),
 			},
-			wantMin: 0.45,
-			wantMax: 0.55,
+			want: 0.5,
 		},
 		{
 			name: "reset in the past clamps to 1.0",
@@ -144,38 +144,36 @@ func TestElapsedRatio(t *testing.T) {
 				PeriodType: PeriodDaily,
 				ResetsAt:   timePtr(now.Add(-1 * time.Hour)),
 			},
-			wantMin: 1.0,
-			wantMax: 1.0,
+			want: 1.0,
 		},
 	}
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := tt.period.ElapsedRatio()
+			got := tt.period.ElapsedRatioAt(now)
 			if tt.wantNil {
 				if got != nil {
-					t.Errorf("ElapsedRatio() = %v, want nil", *got)
+					t.Errorf("ElapsedRatioAt() = %v, want nil", *got)
 				}
 				return
 			}
 			if got == nil {
-				t.Fatal("ElapsedRatio() = nil, want non-nil")
+				t.Fatal("ElapsedRatioAt() = nil, want non-nil")
 			}
-			if *got < tt.wantMin || *got > tt.wantMax {
-				t.Errorf("ElapsedRatio() = %v, want between %v and %v", *got, tt.wantMin, tt.wantMax)
+			if *got != tt.want {
+				t.Errorf("ElapsedRatioAt() = %v, want %v", *got, tt.want)
 			}
 		})
 	}
 }
 
-func TestPaceRatio(t *testing.T) {
-	now := time.Now()
+func TestPaceRatioAt(t *testing.T) {
+	now := fixedNow
 
 	tests := []struct {
 		name    string
 		period  UsagePeriod
 		wantNil bool
-		wantMin float64
-		wantMax float64
+		want    float64
 	}{
 		{
 			name:    "nil reset returns nil",
@@ -192,14 +190,13 @@ func TestPaceRatio(t *testing.T) {
 			wantNil: true,
 		},
 		{
-			name: "on pace ratio near 1.0",
+			name: "on pace ratio is 1.0",
 			period: UsagePeriod{
 				PeriodType:  PeriodDaily,
 				Utilization: 50,
 				ResetsAt:    timePtr(now.Add(12 * time.Hour)),
 			},
-			wantMin: 0.9,
-			wantMax: 1.1,
+			want: 1.0,
 		},
 		{
 			name: "ahead of pace",
@@ -208,8 +205,7 @@ func TestPaceRatio(t *testing.T) {
 				Utilization: 90,
 				ResetsAt:    timePtr(now.Add(12 * time.Hour)),
 			},
-			wantMin: 1.7,
-			wantMax: 2.0,
+			want: 1.8,
 		},
 		{
 			name: "behind pace",
@@ -218,31 +214,30 @@ func TestPaceRatio(t *testing.T) {
 				Utilization: 25,
 				ResetsAt:    timePtr(now.Add(12 * time.Hour)),
 			},
-			wantMin: 0.4,
-			wantMax: 0.6,
+			want: 0.5,
 		},
 	}
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := tt.period.PaceRatio()
+			got := tt.period.PaceRatioAt(now)
 			if tt.wantNil {
 				if got != nil {
-					t.Errorf("PaceRatio() = %v, want nil", *got)
+					t.Errorf("PaceRatioAt() = %v, want nil", *got)
 				}
 				return
 			}
 			if got == nil {
-				t.Fatal("PaceRatio() = nil, want non-nil")
+				t.Fatal("PaceRatioAt() = nil, want non-nil")
 			}
-			if *got < tt.wantMin || *got > tt.wantMax {
-				t.Errorf("PaceRatio() = %v, want between %v and %v", *got, tt.wantMin, tt.wantMax)
+			if *got != tt.want {
+				t.Errorf("PaceRatioAt() = %v, want %v", *got, tt.want)
 			}
 		})
 	}
 }
 
-func TestTimeUntilReset(t *testing.T) {
-	now := time.Now()
+func TestTimeUntilResetAt(t *testing.T) {
+	now := fixedNow
 	future := now.Add(2 * time.Hour)
 	past := now.Add(-1 * time.Hour)
 
@@ -250,8 +245,7 @@ func TestTimeUntilReset(t *testing.T) {
 		name    string
 		period  UsagePeriod
 		wantNil bool
-		wantMin time.Duration
-		wantMax time.Duration
+		want    time.Duration
 	}{
 		{
 			name:    "nil reset returns nil",
@@ -259,32 +253,30 @@ func TestTimeUntilReset(t *testing.T) {
 			wantNil: true,
 		},
 		{
-			name:    "future reset returns positive duration",
-			period:  UsagePeriod{ResetsAt: &future},
-			wantMin: 1*time.Hour + 59*time.Minute,
-			wantMax: 2*time.Hour + 1*time.Minute,
+			name:   "future reset returns positive duration",
+			period: UsagePeriod{ResetsAt: &future},
+			want:   2 * time.Hour,
 		},
 		{
-			name:    "past reset returns zero",
-			period:  UsagePeriod{ResetsAt: &past},
-			wantMin: 0,
-			wantMax: 0,
+			name:   "past reset returns zero",
+			period: UsagePeriod{ResetsAt: &past},
+			want:   0,
 		},
 	}
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := tt.period.TimeUntilReset()
+			got := tt.period.TimeUntilResetAt(now)
 			if tt.wantNil {
 				if got != nil {
-					t.Errorf("TimeUntilReset() = %v, want nil", *got)
+					t.Errorf("TimeUntilResetAt() = %v, want nil", *got)
 				}
 				return
 			}
 			if got == nil {
-				t.Fatal("TimeUntilReset() = nil, want non-nil")
+				t.Fatal("TimeUntilResetAt() = nil, want non-nil")
 			}
-			if *got < tt.wantMin || *got > tt.wantMax {
-				t.Errorf("TimeUntilReset() = %v, want between %v and %v", *got, tt.wantMin, tt.wantMax)
+			if *got != tt.want {
+				t.Errorf("TimeUntilResetAt() = %v, want %v", *got, tt.want)
 			}
 		})
 	}
@@ -29,7 +29,7 @@ func (a Amp) CredentialSources() provider.CredentialInfo {
 }
 
 func (a Amp) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{
 		&CLISecretsStrategy{HTTPTimeout: timeout},
 		&APIKeyStrategy{HTTPTimeout: timeout},
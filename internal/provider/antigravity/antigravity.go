@@ -40,7 +40,7 @@ func (a Antigravity) CredentialSources() provider.CredentialInfo {
 }
 
 func (a Antigravity) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{
 		&OAuthStrategy{HTTPTimeout: timeout},
 	}
@@ -145,7 +145,7 @@ func newOAuthCallbackHandler(expectedState string, resultCh chan<- callbackResul
 
 // exchangeCode exchanges the authorization code for tokens and saves them.
 func exchangeCode(ctx context.Context, w io.Writer, code, redirectURI, verifier string, quiet bool) (bool, error) {
-	client := httpclient.NewFromConfig(config.Get().Fetch.Timeout)
+	client := httpclient.NewFromConfig(config.FetchTimeout())
 
 	var tokenResp google.TokenResponse
 	resp, err := client.PostFormCtx(ctx, google.TokenURL, tokenExchangeForm(code, redirectURI, verifier), &tokenResp)
@@ -32,7 +32,7 @@ func (c Claude) CredentialSources() provider.CredentialInfo {
 }
 
 func (c Claude) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{
 		&OAuthStrategy{HTTPTimeout: timeout},
 		&WebStrategy{HTTPTimeout: timeout},
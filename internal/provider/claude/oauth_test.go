@@ -448,10 +448,7 @@ func TestOAuthCredentials_NeedsRefresh(t *testing.T) {
 }
 
 func TestLoadKeychainCredentials(t *testing.T) {
-	old := readKeychainSecret
-	defer func() { readKeychainSecret = old }()
-
-	readKeychainSecret = func(service, account string) (string, error) {
+	stubKeychainSecret(t, func(service, account string) (string, error) {
 		if service != claudeKeychainSecret {
 			t.Fatalf("service = %q, want %q", service, claudeKeychainSecret)
 		}
@@ -459,7 +456,7 @@ func TestLoadKeychainCredentials(t *testing.T) {
 			t.Fatalf("account = %q, want empty", account)
 		}
 		return `{"claudeAiOauth":{"accessToken":"tok","refreshToken":"ref","expiresAt":4102444800000}}`, nil
-	}
+	})
 
 	s := OAuthStrategy{}
 	creds := s.loadKeychainCredentials()
@@ -608,12 +605,9 @@ func TestFetchWithCredentials_CorruptIdentityCacheWarnsAndFetchesLive(t *testing
 }
 
 func TestLoadKeychainCredentials_Error(t *testing.T) {
-	old := readKeychainSecret
-	defer func() { readKeychainSecret = old }()
-
-	readKeychainSecret = func(service, account string) (string, error) {
+	stubKeychainSecret(t, func(service, account string) (string, error) {
 		return "", errors.New("not found")
-	}
+	})
 
 	s := OAuthStrategy{}
 	if creds := s.loadKeychainCredentials(); creds != nil {
@@ -621,15 +615,22 @@ func TestLoadKeychainCredentials_Error(t *testing.T) {
 	}
 }
 
+// stubKeychainSecret replaces readKeychainSecret with read for the rest of
+// the test, restoring the previous reader when the test ends.
+func stubKeychainSecret(t *testing.T, read func(service, account string) (string, error)) {
+	t.Helper()
+	old := readKeychainSecret
+	t.Cleanup(func() { readKeychainSecret = old })
+	readKeychainSecret = read
+}
+
 // stubKeychainEmpty stubs readKeychainSecret to behave as if the keychain
 // has no entry. It restores the previous stub when the test ends.
 func stubKeychainEmpty(t *testing.T) {
 	t.Helper()
-	old := readKeychainSecret
-	t.Cleanup(func() { readKeychainSecret = old })
-	readKeychainSecret = func(string, string) (string, error) {
+	stubKeychainSecret(t, func(string, string) (string, error) {
 		return "", errors.New("no entry")
-	}
+	})
 }
 
 func writeClaudeAuth(t *testing.T, home, content string) {
@@ -789,11 +790,9 @@ func TestLoadCredentials_DeletesOrphanSlotWhenKeychainPresent(t *testing.T) {
 	setUserHome(t, t.TempDir())
 	testenv.ApplyVibeusage(t.Setenv, t.TempDir())
 
-	old := readKeychainSecret
-	t.Cleanup(func() { readKeychainSecret = old })
-	readKeychainSecret = func(string, string) (string, error) {
+	stubKeychainSecret(t, func(string, string) (string, error) {
 		return `{"claudeAiOauth":{"accessToken":"kc-tok","refreshToken":"kc-ref","expiresAt":4102444800000}}`, nil
-	}
+	})
 
 	if err := config.WriteCredential("claude", "oauth", []byte(`{"access_token":"stale"}`)); err != nil {
 		t.Fatalf("WriteCredential: %v", err)
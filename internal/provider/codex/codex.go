@@ -42,7 +42,7 @@ func (c Codex) CredentialSources() provider.CredentialInfo {
 }
 
 func (c Codex) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{&OAuthStrategy{HTTPTimeout: timeout}}
 }
 
@@ -38,7 +38,7 @@ func (c Copilot) CredentialSources() provider.CredentialInfo {
 }
 
 func (c Copilot) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{&DeviceFlowStrategy{HTTPTimeout: timeout}}
 }
 
@@ -61,7 +61,7 @@ func (c Copilot) Auth() provider.AuthFlow {
 				"grant_type": "urn:ietf:params:oauth:grant-type:device_code",
 			},
 			HTTPOptions:     []httpclient.RequestOption{httpclient.WithHeader("Accept", "application/json")},
-			HTTPTimeout:     config.Get().Fetch.Timeout,
+			HTTPTimeout:     config.FetchTimeout(),
 			ManualCodeEntry: true,
 			FormatCode: func(code string) string {
 				if len(code) == 8 {
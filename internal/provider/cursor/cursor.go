@@ -32,7 +32,7 @@ func (c Cursor) CredentialSources() provider.CredentialInfo {
 }
 
 func (c Cursor) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{&WebStrategy{HTTPTimeout: timeout}}
 }
 
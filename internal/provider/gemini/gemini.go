@@ -31,7 +31,7 @@ func (g Gemini) CredentialSources() provider.CredentialInfo {
 }
 
 func (g Gemini) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{
 		&OAuthStrategy{HTTPTimeout: timeout},
 		&APIKeyStrategy{HTTPTimeout: timeout},
@@ -53,11 +53,17 @@ type CodeAssistTier struct {
 	Name                               string         `json:"name,omitempty"`
 	Description                        string         `json:"description,omitempty"`
 	UserDefinedCloudAICompanionProject bool           `json:"userDefinedCloudaicompanionProject,omitempty"`
-	PrivacyNotice                      map[string]any `json:"privacyNotice,omitempty"`
+	PrivacyNotice                      *PrivacyNotice `json:"privacyNotice,omitempty"`
 	IsDefault                          bool           `json:"isDefault,omitempty"`
 	UsesGCPTos                         bool           `json:"usesGcpTos,omitempty"`
 }
 
+// PrivacyNotice contains the privacy notice configuration for a tier.
+type PrivacyNotice struct {
+	ShowNotice bool   `json:"showNotice,omitempty"`
+	NoticeText string `json:"noticeText,omitempty"`
+}
+
 // UserTier returns a display name for the current tier.
 // Returns empty string if no current tier is set.
 func (r *CodeAssistResponse) UserTier() string {
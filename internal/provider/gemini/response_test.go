@@ -282,6 +282,52 @@ func TestCodeAssistResponse_UnmarshalFullResponse(t *testing.T) {
 	}
 }
 
+func TestCodeAssistResponse_UnmarshalPrivacyNotice(t *testing.T) {
+	raw := `{
+		"currentTier": {
+			"id": "free-tier",
+			"name": "Gemini Code Assist for individuals",
+			"privacyNotice": {
+				"showNotice": true,
+				"noticeText": "Privacy notice text here."
+			}
+		},
+		"allowedTiers": [
+			{
+				"id": "standard-tier",
+				"name": "Gemini Code Assist",
+				"privacyNotice": {}
+			}
+		]
+	}`
+
+	var resp CodeAssistResponse
+	if err := json.Unmarshal([]byte(raw), &resp); err != nil {
+		t.Fatalf("unmarshal failed: %v", err)
+	}
+
+	if resp.CurrentTier == nil {
+		t.Fatal("expected non-nil currentTier")
+	}
+	notice := resp.CurrentTier.PrivacyNotice
+	if notice == nil {
+		t.Fatal("expected non-nil currentTier.privacyNotice")
+	}
+	if !notice.ShowNotice {
+		t.Error("expected currentTier.privacyNotice.showNotice to be true")
+	}
+	if notice.NoticeText != "Privacy notice text here." {
+		t.Errorf("currentTier.privacyNotice.noticeText = %q, want %q", notice.NoticeText, "Privacy notice text here.")
+	}
+
+	if len(resp.AllowedTiers) != 1 {
+		t.Fatalf("len(allowedTiers) = %d, want 1", len(resp.AllowedTiers))
+	}
+	if empty := resp.AllowedTiers[0].PrivacyNotice; empty == nil || empty.ShowNotice || empty.NoticeText != "" {
+		t.Errorf("allowedTiers[0].privacyNotice = %+v, want empty notice", empty)
+	}
+}
+
 func TestCodeAssistResponse_UnmarshalEmpty(t *testing.T) {
 	raw := `{}`
 
@@ -35,7 +35,7 @@ func (k KimiCode) CredentialSources() provider.CredentialInfo {
 }
 
 func (k KimiCode) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{
 		&DeviceFlowStrategy{HTTPTimeout: timeout},
 		&APIKeyStrategy{HTTPTimeout: timeout},
@@ -72,7 +72,7 @@ func (k KimiCode) Auth() provider.AuthFlow {
 				"grant_type": deviceFlowGrant,
 			},
 			HTTPOptions: commonHeaders(),
-			HTTPTimeout: config.Get().Fetch.Timeout,
+			HTTPTimeout: config.FetchTimeout(),
 			ProviderID:  "kimicode",
 			CredType:    "oauth",
 		},
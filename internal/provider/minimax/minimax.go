@@ -30,7 +30,7 @@ func (m Minimax) CredentialSources() provider.CredentialInfo {
 }
 
 func (m Minimax) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{
 		&APIKeyStrategy{HTTPTimeout: timeout},
 	}
@@ -50,7 +50,7 @@ func (o Opencode) CredentialSources() provider.CredentialInfo {
 }
 
 func (o Opencode) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{&WebStrategy{HTTPTimeout: timeout}}
 }
 
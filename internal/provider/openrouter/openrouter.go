@@ -28,7 +28,7 @@ func (o OpenRouter) CredentialSources() provider.CredentialInfo {
 }
 
 func (o OpenRouter) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{&APIKeyStrategy{HTTPTimeout: timeout}}
 }
 
@@ -49,10 +49,7 @@ func (s *stubStrategy) Fetch(_ context.Context) (fetch.FetchResult, error) {
 }
 
 func TestConfiguredIDs_FiltersToRegisteredAndAvailable(t *testing.T) {
-	// Save and restore registry state.
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	Register(&stubProvider{
 		id:         "alpha",
@@ -75,9 +72,7 @@ func TestConfiguredIDs_FiltersToRegisteredAndAvailable(t *testing.T) {
 }
 
 func TestConfiguredIDs_Empty(t *testing.T) {
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	got := ConfiguredIDs([]string{"anything"}, config.DefaultConfig())
 	if len(got) != 0 {
@@ -86,9 +81,7 @@ func TestConfiguredIDs_Empty(t *testing.T) {
 }
 
 func TestConfiguredIDs_MultipleStrategiesOnlyNeedsOne(t *testing.T) {
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	Register(&stubProvider{
 		id: "multi",
@@ -108,9 +101,7 @@ func TestConfiguredIDs_MultipleStrategiesOnlyNeedsOne(t *testing.T) {
 }
 
 func TestConfiguredIDs_ExcludesDisabledProvider(t *testing.T) {
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	Register(&stubProvider{
 		id:         "alpha",
@@ -127,9 +118,7 @@ func TestConfiguredIDs_ExcludesDisabledProvider(t *testing.T) {
 }
 
 func TestDisplayName_KnownProvider(t *testing.T) {
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	Register(&stubProvider{id: "zai", name: "Z.ai"})
 	Register(&stubProvider{id: "claude", name: "Claude"})
@@ -143,9 +132,7 @@ func TestDisplayName_KnownProvider(t *testing.T) {
 }
 
 func TestDisplayName_UnknownProvider(t *testing.T) {
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	// Unknown ID falls back to the ID itself.
 	if got := DisplayName("unknown"); got != "unknown" {
@@ -154,9 +141,7 @@ func TestDisplayName_UnknownProvider(t *testing.T) {
 }
 
 func TestDisplayName_Empty(t *testing.T) {
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	if got := DisplayName(""); got != "" {
 		t.Errorf("DisplayName(%q) = %q, want %q", "", got, "")
@@ -165,9 +150,7 @@ func TestDisplayName_Empty(t *testing.T) {
 
 func TestAvailableIDs_FiltersEnabledAndAvailable(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, t.TempDir())
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	Register(&stubProvider{
 		id:         "alpha",
@@ -198,9 +181,7 @@ func boolPtr(v bool) *bool { return &v }
 func TestAvailableIDs_RespectsConfigDisabledProvider(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, t.TempDir())
 
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	Register(&stubProvider{
 		id:         "alpha",
@@ -225,9 +206,7 @@ func TestAvailableIDs_RespectsConfigDisabledProvider(t *testing.T) {
 
 func TestAvailableIDs_RespectsProviderDisabled(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, t.TempDir())
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	Register(&stubProvider{
 		id:         "alpha",
@@ -252,9 +231,7 @@ func TestAvailableIDs_RespectsProviderDisabled(t *testing.T) {
 
 func TestAvailableIDs_EmptyWhenNoneAvailable(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, t.TempDir())
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	Register(&stubProvider{
 		id:         "alpha",
@@ -271,9 +248,7 @@ func TestAvailableIDs_EmptyWhenNoneAvailable(t *testing.T) {
 
 func TestAvailableIDs_IsSorted(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, t.TempDir())
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	Register(&stubProvider{
 		id:         "zeta",
@@ -303,9 +278,7 @@ func TestCheckCredentials_FallsBackToAvailableStrategy(t *testing.T) {
 	testenv.ApplySameDir(t.Setenv, t.TempDir())
 	config.Override(t, config.DefaultConfig())
 
-	orig := registry
-	registry = map[string]Provider{}
-	defer func() { registry = orig }()
+	withIsolatedRegistry(t)
 
 	Register(&stubProvider{
 		id:         "alpha",
@@ -75,8 +75,8 @@ func TestFetchStatuspageStatus_Indicators(t *testing.T) {
 
 func TestFetchStatuspageStatus_ContextCancellation(t *testing.T) {
 	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		time.Sleep(5 * time.Second)
-		w.WriteHeader(200)
+		// Block until the client gives up rather than sleeping.
+		<-r.Context().Done()
 	}))
 	defer srv.Close()
 
@@ -148,8 +148,8 @@ func TestFetchGoogleAppsStatus_NoKeywordMatch(t *testing.T) {
 
 func TestFetchGoogleAppsStatus_ContextCancellation(t *testing.T) {
 	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		time.Sleep(5 * time.Second)
-		w.WriteHeader(200)
+		// Block until the client gives up rather than sleeping.
+		<-r.Context().Done()
 	}))
 	defer srv.Close()
 
@@ -281,8 +281,8 @@ func TestFetchOnlineOrNotStatus_ServerError(t *testing.T) {
 
 func TestFetchOnlineOrNotStatus_ContextCancellation(t *testing.T) {
 	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
-		time.Sleep(5 * time.Second)
-		w.WriteHeader(200)
+		// Block until the client gives up rather than sleeping.
+		<-r.Context().Done()
 	}))
 	defer srv.Close()
 
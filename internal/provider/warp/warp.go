@@ -31,7 +31,7 @@ func (w Warp) CredentialSources() provider.CredentialInfo {
 }
 
 func (w Warp) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{&APIKeyStrategy{HTTPTimeout: timeout}}
 }
 
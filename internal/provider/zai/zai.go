@@ -30,7 +30,7 @@ func (z Zai) CredentialSources() provider.CredentialInfo {
 }
 
 func (z Zai) FetchStrategies() []fetch.Strategy {
-	timeout := config.Get().Fetch.Timeout
+	timeout := config.FetchTimeout()
 	return []fetch.Strategy{
 		&APIKeyStrategy{HTTPTimeout: timeout},
 	}